@@ -8,13 +8,24 @@ and resolves Jira profiles when multi-profile support is configured.
 import json
 import os
 import re
+import string
 import sys
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
 
-# Jira issue key pattern: PROJECT-123
-# Common project prefixes for Netresearch
-ISSUE_KEY_PATTERN = r"\b([A-Z][A-Z0-9_]+-\d+)\b"
+# The hook runs under the system python3 (not uv), so orjson is optional.
+# Both parsers accept bytes, and orjson.JSONDecodeError subclasses ValueError.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Patterns are compiled once at import: this hook runs on every
+# UserPromptSubmit, so skip the per-call re._compile cache lookup.
+
+# Project prefix of a bare issue key (PROJECT-123 → PROJECT)
+_PREFIX_RE = re.compile(r"^([A-Z][A-Z0-9_]+)-\d+$")
 
 # PREFIX-123 shapes that look like issue keys but never are: security
 # identifiers (CVE-2024, CWE-918, GHSA-…), encodings/standards/crypto
@@ -27,23 +38,46 @@ NON_JIRA_KEY_PREFIXES = frozenset(
 # Literal placeholder keys used in docs and examples (not real tickets).
 PLACEHOLDER_KEYS = frozenset({"ABC-123"})
 
-# Jira URL patterns
-JIRA_URL_PATTERNS = [
-    r"https?://jira\.[^/]+/browse/([A-Z][A-Z0-9_]+-\d+)",
-    r"https?://[^/]+\.atlassian\.net/browse/([A-Z][A-Z0-9_]+-\d+)",
-]
+# Every issue key needs an ASCII uppercase letter and a hyphen; prompts
+# lacking either skip the regex scan entirely.
+_UPPERCASE = frozenset(string.ascii_uppercase)
+
+# ...and a digit; main() uses this to skip JSON parsing of ordinary prompts.
+_DIGIT_RE = re.compile(r"\d")
 
-# Full URL pattern to extract hosts
-JIRA_HOST_PATTERN = r"(https?://(?:jira\.[^\s/]+|[^\s/]+\.atlassian\.net))"
+# stdin is read in blocks so the hyphen/digit check runs as data arrives.
+_STDIN_BLOCK_SIZE = 64 * 1024
+
+# One alternation for everything the hook looks for, so the prompt is
+# scanned once: a Jira host URL (Server/DC "jira.*" or Cloud
+# "*.atlassian.net"), optionally followed by a browse path with an issue
+# key, or a bare issue key (PROJECT-123).
+_SCAN_RE = re.compile(
+    r"(?P<host>https?://(?:jira\.[^\s/?#]+|[^\s/?#]+\.atlassian\.net))(?:/browse/(?P<url_key>[A-Z][A-Z0-9_]+-\d+))?"
+    r"|\b(?P<key>[A-Z][A-Z0-9_]+-\d+)\b"
+)
 
 PROFILES_FILE = Path.home() / ".jira" / "profiles.json"
 
+# Parsed profiles.json keyed by (path, st_mtime_ns); see _load_profiles().
+_PROFILES_CACHE: tuple[tuple[str, int], dict | None] | None = None
 
+
+@lru_cache(maxsize=256)
 def _normalize_netloc(url: str) -> str:
-    """Normalize a URL's netloc by lowercasing and stripping default ports."""
-    parsed = urlparse(url)
-    host = parsed.netloc.lower()
-    scheme = parsed.scheme.lower()
+    """Normalize a URL's netloc by lowercasing and stripping default ports.
+
+    Plain string slicing instead of urlparse(): only scheme and netloc are
+    needed, and profile URLs recur, so results are memoized.
+    """
+    scheme, sep, rest = url.strip().partition("://")
+    if not sep:
+        return ""
+    host = rest
+    for delimiter in "/?#":
+        host = host.partition(delimiter)[0]
+    host = host.lower()
+    scheme = scheme.lower()
     if scheme == "https" and host.endswith(":443"):
         host = host[:-4]
     elif scheme == "http" and host.endswith(":80"):
@@ -65,108 +99,179 @@ def _is_jira_key(key: str) -> bool:
     return prefix not in NON_JIRA_KEY_PREFIXES
 
 
-def extract_issue_keys(text: str) -> list[str]:
-    """Extract unique Jira issue keys from text."""
-    keys = set()
+def extract_all(text: str) -> tuple[list[str], list[str]]:
+    """Extract unique Jira issue keys and host URLs from text in one scan.
 
-    # Direct issue keys
-    for match in re.finditer(ISSUE_KEY_PATTERN, text):
-        key = match.group(1)
-        if _is_jira_key(key):
-            keys.add(key)
+    Returns:
+        (issue_keys, hosts), each sorted for stable output.
+    """
+    # Without a URL only bare keys can match, and those need a hyphen and
+    # an uppercase letter; most prompts fail this and skip the regex scan
+    if "://" not in text and ("-" not in text or _UPPERCASE.isdisjoint(text)):
+        return [], []
+
+    keys: dict[str, None] = {}
+    raw_hosts: dict[str, None] = {}
+    for match in _SCAN_RE.finditer(text):
+        if match.lastgroup == "key":
+            keys[match.group("key")] = None
+            continue
+        raw_hosts[match.group("host")] = None
+        # Keys from browse URLs are inherently Jira, but stay consistent and
+        # drop placeholder/non-Jira shapes like .../browse/PROJ-123 too.
+        if match.group("url_key"):
+            keys[match.group("url_key")] = None
+
+    hosts: dict[str, None] = {}
+    if raw_hosts:
+        # Deferred: most prompts contain no URL, so the hook never pays for it
+        from urllib.parse import urlparse
+
+        for raw in raw_hosts:
+            # Strip trailing punctuation that the regex may have captured
+            # (e.g., "https://jira.example.com)." → "https://jira.example.com")
+            parsed = urlparse(raw.rstrip("/.,;:!?)'\""))
+            if parsed.netloc:
+                hosts[f"{parsed.scheme}://{parsed.netloc}"] = None
+
+    return sorted(key for key in keys if _is_jira_key(key)), sorted(hosts)
 
-    # Issue keys from URLs (inherently Jira, but stay consistent and drop
-    # placeholder/non-Jira shapes like .../browse/PROJ-123 too).
-    for pattern in JIRA_URL_PATTERNS:
-        for match in re.finditer(pattern, text):
-            key = match.group(1)
-            if _is_jira_key(key):
-                keys.add(key)
 
-    return sorted(keys)
+def extract_issue_keys(text: str) -> list[str]:
+    """Extract unique Jira issue keys from text."""
+    if "-" not in text or _UPPERCASE.isdisjoint(text):
+        return []
+    return extract_all(text)[0]
 
 
 def extract_jira_hosts(text: str) -> list[str]:
     """Extract unique Jira host URLs from text."""
-    hosts = set()
-    for match in re.finditer(JIRA_HOST_PATTERN, text):
-        # Strip trailing punctuation that the regex may have captured
-        # (e.g., "https://jira.example.com)." → "https://jira.example.com")
-        raw = match.group(1).rstrip("/").rstrip(".,;:!?)'\"")
-        parsed = urlparse(raw)
-        if parsed.netloc:
-            hosts.add(f"{parsed.scheme}://{parsed.netloc}")
-    return sorted(hosts)
+    if "://" not in text:
+        return []
+    return extract_all(text)[1]
 
 
-def resolve_profile_suggestion(issue_keys: list[str], hosts: list[str]) -> str | None:
-    """Try to resolve a profile name from issue keys or hosts.
+def _load_profiles() -> dict | None:
+    """Load profiles.json and index it for suggestion lookups.
+
+    The result is cached against the file's path and mtime, so repeated
+    lookups cost a single stat() until the file changes.
 
     Returns:
-        Profile name suggestion, or None if no match or no profiles configured.
+        ``{"hosts": {normalized_host: name}, "projects": {prefix: [names]}}``,
+        or None if the file is missing, unreadable, or not shaped like
+        profiles.json.
     """
-    if not PROFILES_FILE.exists():
-        return None
+    global _PROFILES_CACHE
 
     try:
-        data = json.loads(PROFILES_FILE.read_text())
-    except json.JSONDecodeError:
+        st = os.stat(PROFILES_FILE)
+    except OSError:
         return None
 
-    # Validate expected structure: must be a dict with a 'profiles' dict
-    if not isinstance(data, dict):
-        return None
+    cache_key = (str(PROFILES_FILE), st.st_mtime_ns)
+    if _PROFILES_CACHE is not None and _PROFILES_CACHE[0] == cache_key:
+        return _PROFILES_CACHE[1]
 
-    profiles = data.get("profiles", {})
-    if not isinstance(profiles, dict) or not profiles:
+    index = None
+    try:
+        data = _json_loads(PROFILES_FILE.read_bytes())
+    except (OSError, ValueError):
+        data = None
+
+    # Validate expected structure: must be a dict with a non-empty 'profiles' dict
+    profiles = data.get("profiles", {}) if isinstance(data, dict) else None
+    if isinstance(profiles, dict) and profiles:
+        hosts: dict[str, str] = {}
+        projects: dict[str, list[str]] = defaultdict(list)
+        for name, prof in profiles.items():
+            if not isinstance(prof, dict):
+                continue
+            prof_host = _normalize_netloc(prof.get("url", ""))
+            # First profile wins on duplicate hosts, matching profile order
+            if prof_host:
+                hosts.setdefault(prof_host, name)
+            prof_projects = prof.get("projects")
+            if isinstance(prof_projects, list):
+                for prefix in dict.fromkeys(p for p in prof_projects if isinstance(p, str)):
+                    projects[prefix].append(name)
+        index = {"hosts": hosts, "projects": dict(projects)}
+
+    _PROFILES_CACHE = (cache_key, index)
+    return index
+
+
+def resolve_profile_suggestion(issue_keys: list[str], hosts: list[str]) -> str | None:
+    """Try to resolve a profile name from issue keys or hosts.
+
+    Returns:
+        Profile name suggestion, or None if no match or no profiles configured.
+    """
+    index = _load_profiles()
+    if index is None:
         return None
 
     # Try host matching first (normalize default ports for reliable comparison)
     for host_url in hosts:
-        input_host = _normalize_netloc(host_url)
-        for name, prof in profiles.items():
-            prof_host = _normalize_netloc(prof.get("url", ""))
-            if prof_host and prof_host == input_host:
-                return name
+        name = index["hosts"].get(_normalize_netloc(host_url))
+        if name is not None:
+            return name
 
     # Try project key matching
     for key in issue_keys:
-        prefix_match = re.match(r"^([A-Z][A-Z0-9_]+)-\d+$", key)
+        prefix_match = _PREFIX_RE.match(key)
         if prefix_match:
-            prefix = prefix_match.group(1)
-            matches = [
-                name
-                for name, prof in profiles.items()
-                if isinstance(prof.get("projects"), list) and prefix in prof["projects"]
-            ]
+            matches = index["projects"].get(prefix_match.group(1), ())
             if len(matches) == 1:
                 return matches[0]
 
     return None
 
 
+def _read_stdin() -> tuple[str, bool]:
+    """Read stdin in blocks, checking each block for key ingredients.
+
+    Returns:
+        (input_data, may_have_key). may_have_key is False when the input has
+        no hyphen or no digit, so no issue key can be present. The check
+        runs per block while reading and stops once both have been seen,
+        instead of rescanning the whole payload afterwards.
+    """
+    chunks = []
+    has_hyphen = has_digit = False
+    while block := sys.stdin.read(_STDIN_BLOCK_SIZE):
+        chunks.append(block)
+        if not has_hyphen:
+            has_hyphen = "-" in block
+        if not has_digit:
+            has_digit = _DIGIT_RE.search(block) is not None
+    return "".join(chunks), has_hyphen and has_digit
+
+
 def main():
     try:
-        input_data = sys.stdin.read()
+        input_data, may_have_key = _read_stdin()
     except Exception:
         return
 
-    if not input_data:
+    # Skip the JSON parse, which dominates the cost of an ordinary prompt.
+    if not may_have_key:
         return
 
-    # Parse user prompt
-    try:
-        data = json.loads(input_data)
-        prompt = data.get("prompt", "") or data.get("content", "") or data.get("message", "")
-    except (json.JSONDecodeError, TypeError):
-        prompt = input_data
+    # Parse user prompt; plain-text input never reaches the JSON tokenizer
+    prompt = input_data
+    if input_data.lstrip()[:1] in ("{", "["):
+        try:
+            data = json.loads(input_data)
+            prompt = data.get("prompt", "") or data.get("content", "") or data.get("message", "")
+        except (json.JSONDecodeError, AttributeError, TypeError):
+            prompt = input_data
 
     if not prompt:
         return
 
     # Extract issue keys and hosts
-    issue_keys = extract_issue_keys(prompt)
-    hosts = extract_jira_hosts(prompt)
+    issue_keys, hosts = extract_all(prompt)
 
     if issue_keys:
         keys_str = ", ".join(issue_keys)
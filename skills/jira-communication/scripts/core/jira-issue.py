@@ -4,22 +4,22 @@
 # dependencies = [
 #     "atlassian-python-api>=3.41.0,<4",
 #     "click>=8.1.0,<9",
+#     "orjson>=3.9.0,<4",
+#     "requests-cache>=1.1,<2",
 # ]
 # ///
 """Jira issue operations - get, update, and delete issue details."""
 
 import json
+import os
+import re
 import sys
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Shared library import (TR1.1.1 - PYTHONPATH approach)
 # ═══════════════════════════════════════════════════════════════════════════════
-_script_dir = Path(__file__).parent
-_lib_path = _script_dir.parent / "lib"
-if _lib_path.exists():
-    sys.path.insert(0, str(_lib_path.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import click
 from lib.changelog import (
@@ -35,6 +35,13 @@ from lib.client import LazyJiraClient, _sanitize_error, fetch_comments_paginated
 from lib.config import load_status_sets
 from lib.input import read_stdin_utf8
 from lib.output import comment_to_text, compact_json, error, extract_adf_text, format_output, success, warning
+from requests.exceptions import HTTPError
+
+# Keys per JQL search when `get` is given several issue keys (Cloud pages cap at 100).
+GET_BATCH_SIZE = 50
+
+# Comma-separated --fields/--labels, with surrounding whitespace absorbed by the split.
+_COMMA_SPLIT_RE = re.compile(r"\s*,\s*")
 
 
 def _expand_label_args(raw: tuple[str, ...]) -> list[str]:
@@ -126,8 +133,16 @@ def _reference_mismatch(requested, actual) -> tuple[str, str] | None:
 @click.option("--env-file", type=click.Path(), help="Environment file path")
 @click.option("--profile", "-P", help="Jira profile name from ~/.jira/profiles.json")
 @click.option("--debug", is_flag=True, help="Show debug information on errors")
+@click.option(
+    "--cache-ttl",
+    default=0,
+    envvar="JIRA_CACHE_TTL",
+    type=click.IntRange(min=0),
+    metavar="SECONDS",
+    help="Cache 'get' responses on disk for SECONDS (0 = off; other commands always fetch fresh)",
+)
 @click.pass_context
-def cli(ctx, output_json: bool, quiet: bool, env_file: str | None, profile: str | None, debug: bool):
+def cli(ctx, output_json: bool, quiet: bool, env_file: str | None, profile: str | None, debug: bool, cache_ttl: int):
     """Jira issue operations.
 
     Get, update, and delete Jira issue details.
@@ -136,11 +151,15 @@ def cli(ctx, output_json: bool, quiet: bool, env_file: str | None, profile: str
     ctx.obj["json"] = output_json
     ctx.obj["quiet"] = quiet
     ctx.obj["debug"] = debug
-    ctx.obj["client"] = LazyJiraClient(env_file=env_file, profile=profile)
+    # Only the read-only 'get' may use cached responses: update/work/act read
+    # labels and transitions before writing, and a stale GET would be written back.
+    if ctx.invoked_subcommand != "get":
+        cache_ttl = 0
+    ctx.obj["client"] = LazyJiraClient(env_file=env_file, profile=profile, cache_ttl=cache_ttl)
 
 
 @cli.command()
-@click.argument("issue_key")
+@click.argument("issue_keys", nargs=-1, required=True)
 @click.option("--fields", "-f", help="Comma-separated fields to return")
 @click.option("--expand", "-e", help="Fields to expand (changelog,transitions,renderedFields)")
 @click.option("--truncate", type=int, metavar="N", help="Truncate description to N characters")
@@ -158,7 +177,7 @@ def cli(ctx, output_json: bool, quiet: bool, env_file: str | None, profile: str
 @click.pass_context
 def get(
     ctx,
-    issue_key: str,
+    issue_keys: tuple[str, ...],
     fields: str | None,
     expand: str | None,
     truncate: int | None,
@@ -167,12 +186,16 @@ def get(
 ):
     """Get issue details.
 
-    ISSUE_KEY: The Jira issue key (e.g., PROJ-123)
+    ISSUE_KEYS: One or more Jira issue keys (e.g., PROJ-123). Several keys
+    are fetched with one JQL search per 50 keys; web links are then only
+    fetched when requested via --fields weblinks.
 
     Examples:
 
       jira-issue get PROJ-123
 
+      jira-issue get PROJ-123 PROJ-124 PROJ-125
+
       jira-issue get PROJ-123 --fields summary,status,assignee
 
       jira-issue get PROJ-123 --expand changelog,transitions
@@ -181,6 +204,7 @@ def get(
 
       jira-issue --json get PROJ-123 --raw   # full Jira payload, incl. null customfields
     """
+    issue_key = issue_keys[0]
     ctx.obj["client"].with_context(issue_key=issue_key)
     client = ctx.obj["client"]
 
@@ -188,20 +212,14 @@ def get(
     if full:
         warning("--full is deprecated (full content is now shown by default). Use --truncate N to limit output.")
 
-    try:
-        # Normalize requested fields once — used for both fetch gating and display
-        parsed = [f.strip() for f in fields.split(",") if f.strip()] if fields else []
-        requested = set(parsed) if parsed else None
-
-        # Build parameters — strip our pseudo-field "weblinks" before sending to Jira
-        params = {}
-        if parsed:
-            api_fields = ",".join(f for f in parsed if f != "weblinks")
-            if api_fields:
-                params["fields"] = api_fields
-        if expand:
-            params["expand"] = expand
+    # Normalize requested fields once — used for both fetch gating and display
+    requested, params = _issue_fetch_params(fields, expand)
+
+    if len(issue_keys) > 1:
+        _get_many(ctx, issue_keys, requested, params, truncate=truncate, raw=raw)
+        return
 
+    try:
         issue = client.issue(issue_key, **params)
 
         # Fetch web links (separate API call, not a field on the issue)
@@ -232,6 +250,117 @@ def get(
         sys.exit(1)
 
 
+def _issue_fetch_params(fields: str | None, expand: str | None) -> tuple[set | None, dict]:
+    """Parse --fields/--expand into (requested field set, API params).
+
+    The pseudo-field "weblinks" is kept in the requested set but stripped
+    from the params sent to Jira.
+    """
+    parsed = [f for f in _COMMA_SPLIT_RE.split(fields.strip()) if f] if fields else []
+    requested = set(parsed) if parsed else None
+
+    params = {}
+    if parsed:
+        api_fields = ",".join(f for f in parsed if f != "weblinks")
+        if api_fields:
+            params["fields"] = api_fields
+    if expand:
+        params["expand"] = expand
+    return requested, params
+
+
+def _fetch_batch(client, batch: list[str], params: dict) -> list[dict]:
+    """Fetch one batch of issues with a ``key in (...)`` JQL search.
+
+    validateQuery=warn keeps Server/DC from rejecting the whole search over a
+    single unknown or invisible key. Cloud's search endpoint has no such
+    switch, so when the batch still fails with an HTTP error each key is
+    fetched on its own; keys that fail there are simply left out and end up
+    in the caller's "Not returned by Jira" warning.
+    """
+    # json.dumps quotes each key as a JQL string literal
+    jql = f"key in ({', '.join(json.dumps(k) for k in batch)})"
+    try:
+        result = client.jql(
+            jql,
+            limit=len(batch),
+            fields=params.get("fields", "*all"),
+            expand=params.get("expand"),
+            validate_query="warn",
+        )
+        return result.get("issues", []) or []
+    except HTTPError:
+        issues = []
+        for key in batch:
+            try:
+                issues.append(client.issue(key, **params))
+            except HTTPError:
+                continue
+        return issues
+
+
+def _get_many(
+    ctx,
+    issue_keys: tuple[str, ...],
+    requested: set | None,
+    params: dict,
+    truncate: int | None,
+    raw: bool,
+) -> None:
+    """Fetch several issues with batched ``key in (...)`` JQL searches.
+
+    Issues are emitted in argument order. Web links need one request per
+    issue, so they are only fetched when "weblinks" is explicitly requested.
+    """
+    client = ctx.obj["client"]
+    keys = list(dict.fromkeys(issue_keys))
+
+    try:
+        found: dict[str, dict] = {}
+        for i in range(0, len(keys), GET_BATCH_SIZE):
+            batch = keys[i : i + GET_BATCH_SIZE]
+            for issue in _fetch_batch(client, batch, params):
+                found[issue["key"]] = issue
+
+        # Moved issues come back under their new key; keep them, after the rest
+        issues = [found.pop(k) for k in keys if k in found] + list(found.values())
+        if len(issues) < len(keys):
+            returned = {issue["key"] for issue in issues}
+            missing = [k for k in keys if k not in returned]
+            warning(f"Not returned by Jira: {', '.join(missing)}")
+
+        fetch_links = not ctx.obj["quiet"] and requested is not None and "weblinks" in requested
+        links_by_key: dict[str, list] = {}
+        for issue in issues:
+            web_links = []
+            if fetch_links:
+                try:
+                    web_links = client.get_issue_remote_links(issue["key"])
+                except Exception:
+                    if ctx.obj["debug"]:
+                        raise
+                    warning(f"Failed to fetch web links for {issue['key']}")
+            links_by_key[issue["key"]] = web_links
+
+        if ctx.obj["json"]:
+            payloads = []
+            for issue in issues:
+                issue["webLinks"] = links_by_key[issue["key"]]
+                payloads.append(issue if raw else compact_json(issue))
+            format_output(payloads, as_json=True)
+        elif ctx.obj["quiet"]:
+            print("\n".join(issue["key"] for issue in issues))
+        else:
+            for issue in issues:
+                _print_issue(issue, truncate=truncate, requested_fields=requested, web_links=links_by_key[issue["key"]])
+
+    except Exception as e:
+        if ctx.obj["debug"]:
+            raise
+        error(f"Failed to get issues {', '.join(keys)}: {e}")
+        sys.exit(1)
+
+
 def _print_issue(
     issue: dict,
     truncate: int | None = None,
@@ -249,71 +378,71 @@ def _print_issue(
     fields = issue.get("fields", {})
     # Accept both set and comma-separated string for backwards compatibility
     if isinstance(requested_fields, str):
-        requested = set(f.strip() for f in requested_fields.split(","))
+        requested = set(_COMMA_SPLIT_RE.split(requested_fields.strip()))
     else:
         requested = requested_fields
 
-    def should_show(field_name: str) -> bool:
-        """Check if a field should be shown based on requested fields."""
-        if requested is None:
-            return True
-        return field_name in requested
+    # Lines are collected and written once at the end instead of one
+    # print() per line.
+    out: list[str] = []
+    emit = out.append
 
-    def field_available(field_name: str) -> bool:
-        """Check if a field was returned by the API."""
-        return field_name in fields
+    # Fields that are both requested (or unfiltered) and present in the
+    # response, computed once rather than via two helper calls per section.
+    shown = fields.keys() if requested is None else requested & fields.keys()
 
     # Header with summary
-    if should_show("summary") or requested is None:
-        summary = fields.get("summary", "No summary") if field_available("summary") else "[not requested]"
-        print(f"\n{issue['key']}: {summary}")
-        print("=" * 60)
+    if requested is None or "summary" in requested:
+        summary = fields.get("summary", "No summary") if "summary" in fields else "[not requested]"
+        emit(f"\n{issue['key']}: {summary}")
+        emit("=" * 60)
     else:
-        print(f"\n{issue['key']}")
-        print("=" * 60)
+        emit(f"\n{issue['key']}")
+        emit("=" * 60)
 
     # Status, type, priority row - only show if any were requested or no filter
-    show_status_row = requested is None or any(f in requested for f in ["status", "issuetype", "priority"])
+    show_status_row = requested is None or not requested.isdisjoint(("status", "issuetype", "priority"))
     if show_status_row:
         parts = []
-        if should_show("issuetype") and field_available("issuetype"):
+        if "issuetype" in shown:
             issue_type = fields.get("issuetype", {}).get("name", "Unknown")
             parts.append(f"Type: {issue_type}")
-        if should_show("status") and field_available("status"):
+        if "status" in shown:
             status = fields.get("status", {}).get("name", "Unknown")
             parts.append(f"Status: {status}")
-        if should_show("priority") and field_available("priority"):
-            priority = fields.get("priority", {}).get("name", "None") if fields.get("priority") else "None"
+        if "priority" in shown:
+            priority = fields.get("priority")
+            priority = priority.get("name", "None") if priority else "None"
             parts.append(f"Priority: {priority}")
         if parts:
-            print(" | ".join(parts))
+            emit(" | ".join(parts))
 
     # Assignee and reporter row
-    show_people_row = requested is None or any(f in requested for f in ["assignee", "reporter"])
+    show_people_row = requested is None or not requested.isdisjoint(("assignee", "reporter"))
     if show_people_row:
         parts = []
-        if should_show("assignee") and field_available("assignee"):
+        if "assignee" in shown:
             assignee = fields.get("assignee", {})
             assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
             parts.append(f"Assignee: {assignee_name}")
-        if should_show("reporter") and field_available("reporter"):
+        if "reporter" in shown:
             reporter = fields.get("reporter", {})
             reporter_name = reporter.get("displayName", "Unknown") if reporter else "Unknown"
             parts.append(f"Reporter: {reporter_name}")
         if parts:
-            print(" | ".join(parts))
+            emit(" | ".join(parts))
 
     # Labels
-    if should_show("labels") and field_available("labels"):
+    if "labels" in shown:
         labels = fields.get("labels", [])
         if labels:
-            print(f"Labels: {', '.join(labels)}")
+            emit(f"Labels: {', '.join(labels)}")
 
     # Description
-    if should_show("description") and field_available("description"):
+    if "description" in shown:
         description = fields.get("description")
         if description:
-            print("\nDescription:")
+            emit("\nDescription:")
             # Handle both string and ADF format
             if isinstance(description, str):
                 desc_text = description
@@ -327,45 +456,46 @@ def _print_issue(
             if truncate and len(desc_text) > truncate:
                 # Find word boundary for clean truncation
                 truncated = desc_text[:truncate].rsplit(" ", 1)[0]
-                print(f"  {truncated}...")
-                print(f"  [truncated at {truncate} chars]")
+                emit(f"  {truncated}...")
+                emit(f"  [truncated at {truncate} chars]")
             else:
                 # Print full description, preserving line breaks
-                for line in desc_text.split("\n"):
-                    print(f"  {line}")
+                emit("  " + desc_text.replace("\n", "\n  "))
 
     # Dates
-    show_dates_row = requested is None or any(f in requested for f in ["created", "updated"])
+    show_dates_row = requested is None or not requested.isdisjoint(("created", "updated"))
     if show_dates_row:
         parts = []
-        if should_show("created") and field_available("created"):
-            created = fields.get("created", "")[:10] if fields.get("created") else "N/A"
+        if "created" in shown:
+            created = fields.get("created")
+            created = created[:10] if created else "N/A"
             parts.append(f"Created: {created}")
-        if should_show("updated") and field_available("updated"):
-            updated = fields.get("updated", "")[:10] if fields.get("updated") else "N/A"
+        if "updated" in shown:
+            updated = fields.get("updated")
+            updated = updated[:10] if updated else "N/A"
             parts.append(f"Updated: {updated}")
         if parts:
-            print(f"\n{' | '.join(parts)}")
+            emit(f"\n{' | '.join(parts)}")
 
     # Attachments
-    if should_show("attachment") and field_available("attachment"):
+    if "attachment" in shown:
         attachments = fields.get("attachment", [])
         if attachments:
-            print("\n" + "=" * 60)
-            print("ATTACHMENTS")
-            print("=" * 60)
+            emit("\n" + "=" * 60)
+            emit("ATTACHMENTS")
+            emit("=" * 60)
             for att in attachments:
                 filename = att.get("filename", "Unknown")
                 url = att.get("content", "")
-                print(f"  • {filename} - {url}")
+                emit(f"  • {filename} - {url}")
 
     # Issue Links
-    if should_show("issuelinks") and field_available("issuelinks"):
+    if "issuelinks" in shown:
         issue_links = fields.get("issuelinks", [])
         if issue_links:
-            print("\n" + "=" * 60)
-            print("ISSUE LINKS")
-            print("=" * 60)
+            emit("\n" + "=" * 60)
+            emit("ISSUE LINKS")
+            emit("=" * 60)
             for link in issue_links:
                 link_type = link.get("type", {})
                 if "outwardIssue" in link:
@@ -373,30 +503,30 @@ def _print_issue(
                     label = link_type.get("outward", "links to")
                     key = outward.get("key", "?")
                     summary = outward.get("fields", {}).get("summary", "")
-                    print(f"  {label} \u2192 {key}: {summary}")
+                    emit(f"  {label} \u2192 {key}: {summary}")
                 if "inwardIssue" in link:
                     inward = link["inwardIssue"]
                     label = link_type.get("inward", "is linked by")
                     key = inward.get("key", "?")
                     summary = inward.get("fields", {}).get("summary", "")
-                    print(f"  {label} \u2190 {key}: {summary}")
+                    emit(f"  {label} \u2190 {key}: {summary}")
 
     # Web Links (from separate API call, gated by --fields like issue links)
-    if web_links and should_show("weblinks"):
-        print("\n" + "=" * 60)
-        print("WEB LINKS")
-        print("=" * 60)
+    if web_links and (requested is None or "weblinks" in requested):
+        emit("\n" + "=" * 60)
+        emit("WEB LINKS")
+        emit("=" * 60)
         for link in web_links:
             link_id = link.get("id", "?")
             obj = link.get("object", {})
             title = obj.get("title", "(untitled)")
             link_url = obj.get("url", "")
-            print(f"  [{link_id}] {title} \u2014 {link_url}")
+            emit(f"  [{link_id}] {title} \u2014 {link_url}")
 
     # Comments \u2014 always surface the count when the comment field is present, so a
     # populated discussion is never invisible (the original silent `-f comment` trap).
     # Full bodies stay in the `work` command / `jira-comment.py list`.
-    if field_available("comment"):
+    if "comment" in fields:
         comment_field = fields.get("comment") or {}
         # Jira may send total/comments as explicit null, so guard against None
         # rather than relying on dict.get defaults (a present-but-null key skips them).
@@ -404,31 +534,31 @@ def _print_issue(
         if comment_total is None:
             comment_total = len(comment_field.get("comments") or [])
         if comment_total:
-            print(
+            emit(
                 f"\nComments: {comment_total} "
                 f"(run `jira-issue.py work {issue['key']}` or `jira-comment.py list {issue['key']}` to read them)"
             )
         else:
-            print("\nComments: 0")
+            emit("\nComments: 0")
 
     # Parent \u2014 cheap, high-value metadata; same silent-omission gap as comments.
-    if field_available("parent"):
+    if "parent" in fields:
         parent = fields.get("parent") or {}
         parent_key = parent.get("key")
         if parent_key:
             parent_summary = (parent.get("fields") or {}).get("summary", "")
-            print(f"\nParent: {parent_key}" + (f": {parent_summary}" if parent_summary else ""))
+            emit(f"\nParent: {parent_key}" + (f": {parent_summary}" if parent_summary else ""))
 
     # Subtasks \u2014 list compactly (keys are short); closes the silent `-f subtasks` gap.
-    if field_available("subtasks"):
+    if "subtasks" in fields:
         subtasks = fields.get("subtasks") or []
         if subtasks:
-            print(f"\nSubtasks ({len(subtasks)}):")
+            emit(f"\nSubtasks ({len(subtasks)}):")
             for subtask in subtasks:
                 subtask_fields = subtask.get("fields") or {}
                 subtask_status = (subtask_fields.get("status") or {}).get("name", "")
                 suffix = f" [{subtask_status}]" if subtask_status else ""
-                print(f"  \u2022 {subtask.get('key', '?')}: {subtask_fields.get('summary') or ''}{suffix}")
+                emit(f"  \u2022 {subtask.get('key', '?')}: {subtask_fields.get('summary') or ''}{suffix}")
 
     # Safety net: never let an explicitly requested field render nothing silently.
     # Any -f field that reached the payload but has no renderer above gets a
@@ -453,10 +583,12 @@ def _print_issue(
             "subtasks",
         }
         for field_name in sorted(requested):
-            if field_name not in rendered_fields and field_available(field_name):
-                print(f"\n{field_name}: present in the response but not rendered here, use `--json` to view it")
+            if field_name not in rendered_fields and field_name in fields:
+                emit(f"\n{field_name}: present in the response but not rendered here, use `--json` to view it")
+
+    emit("")
 
-    print()
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 @cli.command("time-in-status")
@@ -672,7 +804,7 @@ def update(
         sys.exit(1)
 
     if labels:
-        update_fields["labels"] = [l.strip() for l in labels.split(",")]
+        update_fields["labels"] = _COMMA_SPLIT_RE.split(labels.strip())
 
     if add_label or remove_label:
         issue = client.issue(issue_key, fields="labels")
@@ -4,25 +4,36 @@
 # dependencies = [
 #     "atlassian-python-api>=3.41.0,<4",
 #     "click>=8.1.0,<9",
+#     "orjson>=3.9.0,<4",
+#     "requests-cache>=1.1,<2",
 # ]
 # ///
 """Jira search operations - query issues using JQL."""
 
+import os
 import re
 import sys
-from pathlib import Path
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Shared library import (TR1.1.1 - PYTHONPATH approach)
 # ═══════════════════════════════════════════════════════════════════════════════
-_script_dir = Path(__file__).parent
-_lib_path = _script_dir.parent / "lib"
-if _lib_path.exists():
-    sys.path.insert(0, str(_lib_path.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import click
-from lib.client import LazyJiraClient
-from lib.output import error, format_output, format_table, warning
+from lib.client import HTTP_POOL_SIZE, LazyJiraClient
+from lib.config import is_cloud_url
+from lib.output import error, format_output, stream_table, warning
+
+# Default issues per search request when --max-results spans several pages.
+SEARCH_PAGE_SIZE = 100
+
+# Columns requested and shown when --fields is not given.
+DEFAULT_FIELDS = ("key", "summary", "status", "assignee", "priority")
+_DEFAULT_FIELDS_ARG = ",".join(DEFAULT_FIELDS)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CLI Definition
@@ -35,8 +46,16 @@ from lib.output import error, format_output, format_table, warning
 @click.option("--env-file", type=click.Path(), help="Environment file path")
 @click.option("--profile", "-P", help="Jira profile name from ~/.jira/profiles.json")
 @click.option("--debug", is_flag=True, help="Show debug information on errors")
+@click.option(
+    "--cache-ttl",
+    default=0,
+    envvar="JIRA_CACHE_TTL",
+    type=click.IntRange(min=0),
+    metavar="SECONDS",
+    help="Cache GET responses on disk for SECONDS (0 = off)",
+)
 @click.pass_context
-def cli(ctx, output_json: bool, quiet: bool, env_file: str | None, profile: str | None, debug: bool):
+def cli(ctx, output_json: bool, quiet: bool, env_file: str | None, profile: str | None, debug: bool, cache_ttl: int):
     """Jira search operations.
 
     Query Jira issues using JQL (Jira Query Language).
@@ -45,13 +64,21 @@ def cli(ctx, output_json: bool, quiet: bool, env_file: str | None, profile: str
     ctx.obj["json"] = output_json
     ctx.obj["quiet"] = quiet
     ctx.obj["debug"] = debug
-    ctx.obj["client"] = LazyJiraClient(env_file=env_file, profile=profile)
+    ctx.obj["client"] = LazyJiraClient(env_file=env_file, profile=profile, cache_ttl=cache_ttl)
 
 
 _ORDER_BY_RE = re.compile(r"\border\s+by\b", re.IGNORECASE)
 # Strip 'single-quoted' and "double-quoted" string literals so values
 # like `summary ~ 'order by'` don't trip the ORDER BY detector.
 _QUOTED_RE = re.compile(r"'(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\"")
+# Comma-separated --fields, with surrounding whitespace absorbed by the split.
+_COMMA_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=32)
+def _parse_fields(fields: str) -> tuple[str, ...]:
+    """Split a --fields value into an immutable field tuple, memoized per string."""
+    return tuple(_COMMA_SPLIT_RE.split(fields.strip()))
 
 
 def _has_top_level_order_by(jql: str) -> bool:
@@ -90,7 +117,7 @@ def _append_order_by(jql: str, order_by_clauses: tuple[str, ...]) -> str:
 @cli.command()
 @click.argument("jql")
 @click.option("--max-results", "-n", default=50, help="Maximum results to return")
-@click.option("--fields", "-f", default="key,summary,status,assignee,priority", help="Comma-separated fields to return")
+@click.option("--fields", "-f", default=_DEFAULT_FIELDS_ARG, help="Comma-separated fields to return")
 @click.option(
     "--start-at",
     default=0,
@@ -109,6 +136,21 @@ def _append_order_by(jql: str, order_by_clauses: tuple[str, ...]) -> str:
         "Tip: ORDER BY can also be embedded directly in the JQL string."
     ),
 )
+@click.option(
+    "--page-size",
+    default=SEARCH_PAGE_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Issues per request when --max-results spans several pages",
+)
+@click.option(
+    "--workers",
+    default=5,
+    show_default=True,
+    type=click.IntRange(min=1, max=HTTP_POOL_SIZE, clamp=True),
+    help="Concurrent page requests when --max-results spans several pages (Server/DC)",
+)
+@click.option("--no-cache", is_flag=True, help="Fetch fresh results even when --cache-ttl is set")
 @click.pass_context
 def query(
     ctx,
@@ -118,6 +160,9 @@ def query(
     start_at: int,
     truncate: int | None,
     order_by: tuple[str, ...],
+    page_size: int,
+    workers: int,
+    no_cache: bool,
 ):
     """Search issues using JQL.
 
@@ -129,6 +174,8 @@ def query(
 
       jira-search query "assignee = currentUser()" --max-results 20
 
+      jira-search query "project = PROJ" --max-results 1000 --workers 8
+
       jira-search query "project = PROJ" --order-by "updated DESC"
 
       jira-search query "project = PROJ" --order-by "priority DESC" --order-by "created ASC"
@@ -137,6 +184,8 @@ def query(
 
       jira-search --quiet query "labels = urgent"
 
+      jira-search --cache-ttl 60 query "sprint in openSprints()"
+
     Common JQL patterns:
 
       project = PROJ                    # Issues in project
@@ -154,6 +203,8 @@ def query(
       --order-by flag. Use one form or the other, not both.
     """
     client = ctx.obj["client"]
+    if no_cache:
+        client.without_cache()
 
     try:
         jql = _append_order_by(jql, order_by)
@@ -161,10 +212,17 @@ def query(
         error(str(e))
         sys.exit(2)
 
-    field_list = [f.strip() for f in fields.split(",")]
+    field_list = DEFAULT_FIELDS if fields == _DEFAULT_FIELDS_ARG else _parse_fields(fields)
+    # --quiet prints keys only, so don't have Jira send (and us decode) the rest;
+    # --json takes precedence over --quiet and still needs the requested fields
+    api_fields = ("key",) if ctx.obj["quiet"] and not ctx.obj["json"] else field_list
 
     try:
-        results = client.jql(jql, limit=max_results, start=start_at, fields=field_list)
+        pages = _iter_search_pages(client, jql, api_fields, start_at, max_results, page_size, workers)
+        if ctx.obj["quiet"] and not ctx.obj["json"]:
+            results = _stream_keys(pages)
+        else:
+            results = _merge_pages(pages, max_results)
     except Exception as e:
         if ctx.obj["debug"]:
             raise
@@ -177,6 +235,73 @@ def query(
     _emit_query_output(ctx, issues, field_list, truncate, total, start_at)
 
 
+def _iter_search_pages(
+    client, jql: str, fields: tuple[str, ...], start_at: int, max_results: int, page_size: int, workers: int
+) -> Iterator[dict]:
+    """Yield the responses covering the [start_at, start_at + max_results) window, in order.
+
+    Windows larger than one page are split into page_size requests: the
+    first page doubles as the probe for ``total`` and for a server-side page
+    cap, the remaining offsets are fetched concurrently and yielded in order.
+    Cloud search is cursor-based (see LazyJiraClient.jql), so offsets there
+    cannot be fetched independently and the window is requested in a single
+    call.
+    """
+    if max_results <= page_size or workers == 1 or is_cloud_url(client.url or ""):
+        yield client.jql(jql, limit=max_results, start=start_at, fields=fields)
+        return
+
+    first = client.jql(jql, limit=page_size, start=start_at, fields=fields)
+    yield first
+    issues = first.get("issues", [])
+    total = first.get("total")
+    if not isinstance(total, int) or not issues:
+        return
+
+    end = min(start_at + max_results, total)
+    if len(issues) < page_size:
+        if start_at + len(issues) >= end:
+            return
+        # Short first page with more results pending: the server caps
+        # maxResults below page_size. Continue at the cap it enforces.
+        warning(f"Server caps page size at {len(issues)}; continuing with --page-size {len(issues)}")
+        page_size = len(issues)
+
+    def fetch(offset: int) -> dict:
+        return client.jql(jql, limit=min(page_size, end - offset), start=offset, fields=fields)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(fetch, range(start_at + page_size, end, page_size))
+
+
+def _merge_pages(pages: Iterator[dict], max_results: int) -> dict:
+    """Collapse the page responses into the first one, issues concatenated in order."""
+    first = next(pages)
+    rest = list(pages)
+    if not rest:
+        return first
+    issues = list(first.get("issues", []))
+    for page in rest:
+        issues.extend(page.get("issues", []))
+    return {**first, "issues": issues, "maxResults": max_results}
+
+
+def _stream_keys(pages: Iterator[dict]) -> dict:
+    """Write issue keys (--quiet) page by page as the responses arrive.
+
+    Returns the merged response, whose issues feed the capped-results warning.
+    """
+    first = next(pages)
+    issues: list = []
+    for page in chain((first,), pages):
+        page_issues = page.get("issues", [])
+        if page_issues:
+            sys.stdout.write("".join(f"{issue['key']}\n" for issue in page_issues))
+            sys.stdout.flush()
+        issues.extend(page_issues)
+    return {**first, "issues": issues}
+
+
 def _warn_if_capped(issues: list, total, max_results: int, start_at: int) -> None:
     if isinstance(total, int) and max_results > len(issues) and (start_at + len(issues)) < total:
         warning(
@@ -186,15 +311,15 @@ def _warn_if_capped(issues: list, total, max_results: int, start_at: int) -> Non
         )
 
 
-def _emit_query_output(ctx, issues: list, field_list: list, truncate: int | None, total, start_at: int) -> None:
+def _emit_query_output(
+    ctx, issues: list, field_list: tuple[str, ...], truncate: int | None, total, start_at: int
+) -> None:
     """Render search results in json / quiet / table form."""
     if ctx.obj["json"]:
         format_output(issues, as_json=True)
         return
     if ctx.obj["quiet"]:
-        for issue in issues:
-            print(issue["key"])
-        return
+        return  # keys were already streamed by _stream_keys()
     if total is None:
         total = len(issues)
     if not issues:
@@ -203,61 +328,78 @@ def _emit_query_output(ctx, issues: list, field_list: list, truncate: int | None
         else:
             print("No issues found")
         return
-    _print_results_table(issues, field_list, truncate=truncate)
+    # "key" is always the first column and comes from the issue itself, not its fields
+    value_fields = tuple(f for f in field_list if f != "key")
+    _print_results_table(issues, value_fields, ("key", *value_fields), truncate=truncate)
     issue_label = "issue" if total == 1 else "issues"
     print(f"\n(showing {start_at + 1}-{start_at + len(issues)} of {total} {issue_label})")
 
 
-def _print_results_table(issues: list, fields: list, truncate: int | None = None) -> None:
+def _print_results_table(
+    issues: list, value_fields: tuple[str, ...], columns: tuple[str, ...], truncate: int | None = None
+) -> None:
     """Print search results as a table.
 
     Args:
         issues: List of issue dicts from Jira API
-        fields: List of field names to display
+        value_fields: Field names to display after the key column
+        columns: Column order, "key" first
         truncate: If set, truncate field values to this many characters
     """
-    # Build table data
-    rows = []
+    stream_table(_result_rows(issues, value_fields, truncate), columns)
+
+
+def _dict_cell(value: dict) -> str:
+    """Nested objects: prefer name, then displayName, then value."""
+    if "name" in value:
+        return value["name"]
+    if "displayName" in value:
+        return value["displayName"]
+    if "value" in value:
+        return value["value"]
+    return str(value)
+
+
+def _list_cell(value: list) -> str:
+    """Lists: first three items, with an ellipsis when there are more."""
+    text = ", ".join(str(v) for v in value[:3])
+    return text + "..." if len(value) > 3 else text
+
+
+# Cell formatter per JSON value type, looked up once per cell instead of an
+# isinstance() chain; anything else (numbers, booleans) goes through str().
+_CELL_FORMATTERS = {
+    str: str,
+    dict: _dict_cell,
+    list: _list_cell,
+    type(None): lambda _value: "-",
+}
+
+
+def _result_rows(issues: list, value_fields: tuple[str, ...], truncate: int | None):
+    """Yield one display row per issue; format_table() consumes them lazily.
+
+    *value_fields* must not include "key", which every row takes from the issue.
+    """
+    formatters = _CELL_FORMATTERS
+    keep = truncate - 3 if truncate else 0
     for issue in issues:
         row = {"key": issue["key"]}
         issue_fields = issue.get("fields", {})
 
-        for field in fields:
-            if field == "key":
-                continue
-
+        for field in value_fields:
             value = issue_fields.get(field)
-
-            # Handle nested objects
-            if isinstance(value, dict):
-                if "name" in value:
-                    value = value["name"]
-                elif "displayName" in value:
-                    value = value["displayName"]
-                elif "value" in value:
-                    value = value["value"]
-                else:
-                    value = str(value)
-            elif isinstance(value, list):
-                value = ", ".join(str(v) for v in value[:3])
-                if len(issue_fields.get(field, [])) > 3:
-                    value += "..."
-            elif value is None:
-                value = "-"
-            else:
-                value = str(value)
+            text = formatters.get(type(value), str)(value)
+            if type(text) is not str:  # e.g. a numeric "value" picked by _dict_cell
+                text = str(text)
 
             # Truncate if requested
-            if truncate and len(str(value)) > truncate:
-                value = str(value)[: truncate - 3] + "..."
-
-            row[field] = value
+            if truncate and len(text) > truncate:
+                text = text[:keep] + "..."
 
-        rows.append(row)
+            row[field] = text
 
-    # Print table
-    columns = ["key"] + [f for f in fields if f != "key"]
-    print(format_table(rows, columns))
+        yield row
 
 
 if __name__ == "__main__":
@@ -11,31 +11,37 @@
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Shared library import (TR1.1.1 - PYTHONPATH approach)
 # ═══════════════════════════════════════════════════════════════════════════════
-_script_dir = Path(__file__).parent
-_lib_path = _script_dir.parent / "lib"
-if _lib_path.exists():
-    sys.path.insert(0, str(_lib_path.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import json
 
 import click
 import requests
-from atlassian import Jira
 from lib.client import (
     JIRA_TIMEOUT,
     AuthenticationError,
     SessionExpiredError,
+    _jira_class,
     _patch_session_for_response_validation,
     _sanitize_error,
 )
 from lib.config import DEFAULT_ENV_FILE, PROFILES_FILE, is_cloud_url, load_env
 from lib.output import error, success, warning
 
+if TYPE_CHECKING:
+    from atlassian import Jira
+else:
+    # Resolved by validate_credentials() via lib.client._jira_class(), so the
+    # prompts, --help and --migrate never load the atlassian package.
+    Jira = None
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Exit Codes
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -43,6 +49,26 @@ EXIT_SUCCESS = 0
 EXIT_USER_ABORT = 1
 EXIT_VALIDATION_FAILED = 2
 
+# (connect, read) seconds for the reachability probe: an unroutable host fails
+# after 3 s instead of holding the interactive flow for the full read budget.
+URL_CHECK_TIMEOUT = (3, 7)
+
+# Shared keep-alive session for the URL probe and credential check; see _http_session().
+_SESSION: requests.Session | None = None
+
+
+def _http_session() -> requests.Session:
+    """Return the session shared by validate_url() and validate_credentials().
+
+    Setup probes the server and then authenticates against the same host, so
+    one session lets the credential check reuse the TCP/TLS connection opened
+    by the reachability probe (and its HEAD-to-GET fallback).
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+    return _SESSION
+
 
 def detect_jira_type(url: str) -> str:
     """Detect if URL is Jira Cloud or Server/Data Center.
@@ -69,11 +95,12 @@ def validate_url(url: str) -> tuple[bool, str]:
         return False, "URL must start with http:// or https://"
 
     try:
-        response = requests.head(url, timeout=10, allow_redirects=True)
+        session = _http_session()
+        response = session.head(url, timeout=URL_CHECK_TIMEOUT, allow_redirects=True)
         status = response.status_code
         # 405 = HEAD not allowed — fall back to GET
         if status == 405:
-            response = requests.get(url, timeout=10, allow_redirects=True, stream=True)
+            response = session.get(url, timeout=URL_CHECK_TIMEOUT, allow_redirects=True, stream=True)
             response.close()
             status = response.status_code
         if status < 400:
@@ -101,19 +128,22 @@ def validate_credentials(url: str, auth_type: str, **kwargs) -> tuple[bool, str]
         Tuple of (success, message/user_info)
     """
     try:
+        jira_cls = Jira or _jira_class()
         if auth_type == "cloud":
-            client = Jira(
+            client = jira_cls(
                 url=url,
                 username=kwargs["username"],
                 password=kwargs["api_token"],
                 cloud=True,
                 timeout=JIRA_TIMEOUT,
+                session=_http_session(),
             )
         else:
-            client = Jira(
+            client = jira_cls(
                 url=url,
                 token=kwargs["personal_token"],
                 timeout=JIRA_TIMEOUT,
+                session=_http_session(),
             )
 
         _patch_session_for_response_validation(client, url)
@@ -214,11 +244,18 @@ def write_profile(profile_name: str, profile_data: dict) -> None:
     if "default" not in data or not data["default"]:
         data["default"] = profile_name
 
-    # Write with restricted permissions from creation (no race condition)
-    fd = os.open(PROFILES_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-    with os.fdopen(fd, "w") as f:
-        f.write(json.dumps(data, indent=2) + "\n")
-    os.chmod(PROFILES_FILE, 0o600)
+    # Write a sibling temp file with restricted permissions from creation (no
+    # race condition), then swap it in so readers never see a torn file.
+    tmp_path = PROFILES_FILE.with_suffix(".json.tmp")
+    tmp_path.unlink(missing_ok=True)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(data, indent=2) + "\n")
+        os.replace(tmp_path, PROFILES_FILE)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def migrate_env_to_profile() -> None:
@@ -354,16 +391,11 @@ def main(
     if url.startswith("http://") and not url.startswith("http://localhost"):
         warning("Using HTTP without TLS. Credentials will be transmitted in plaintext.")
 
-    # Validate URL
-    click.echo()
-    click.echo("Validating URL...", nl=False)
-    url_ok, url_msg = validate_url(url)
-    if url_ok:
-        click.echo(f" ✓ {url_msg}")
-    else:
-        click.echo(" ✗")
-        error(f"URL validation failed: {url_msg}")
-        sys.exit(EXIT_VALIDATION_FAILED)
+    # Probe the URL in the background while the user confirms the Jira type;
+    # the result is reported before any credentials are asked for.
+    probe = ThreadPoolExecutor(max_workers=1)
+    url_check = probe.submit(validate_url, url)
+    probe.shutdown(wait=False)
 
     # Step 2: Detect/confirm Jira type
     click.echo()
@@ -384,6 +416,17 @@ def main(
         else:
             jira_type = detected
 
+    # Validate URL
+    click.echo()
+    click.echo("Validating URL...", nl=False)
+    url_ok, url_msg = url_check.result()
+    if url_ok:
+        click.echo(f" ✓ {url_msg}")
+    else:
+        click.echo(" ✗")
+        error(f"URL validation failed: {url_msg}")
+        sys.exit(EXIT_VALIDATION_FAILED)
+
     click.echo()
 
     # Step 3: Get credentials
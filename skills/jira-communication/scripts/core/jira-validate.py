@@ -9,20 +9,18 @@
 # ///
 """Jira environment validation - verify runtime, configuration, and connectivity."""
 
+import os
 import shutil
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NoReturn
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Shared library import (TR1.1.1 - PYTHONPATH approach)
 # ═══════════════════════════════════════════════════════════════════════════════
-_script_dir = Path(__file__).parent
-_lib_path = _script_dir.parent / "lib"
-if _lib_path.exists():
-    sys.path.insert(0, str(_lib_path.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import json as json_module
 
 import click
 import requests
@@ -37,7 +35,9 @@ from lib.config import (
     profile_to_config,
     validate_config,
 )
-from lib.output import error, format_table, success, warning
+from lib.output import error, format_json, format_table, success, warning
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Exit Codes (TR2.3)
@@ -47,21 +47,62 @@ EXIT_RUNTIME_ERROR = 1
 EXIT_CONFIG_ERROR = 2
 EXIT_CONNECTION_ERROR = 3
 
+# Concurrent HEAD probes for --all-profiles (matches the session's pool size)
+PROBE_WORKERS = 10
+# (connect, read): an unreachable host fails after 3 s, a slow one still gets 5 s
+PROBE_TIMEOUT = (3, 5)
+# Single-attempt serverInfo reachability check in check_connectivity (seconds)
+SERVER_INFO_TIMEOUT = 10
 
-def check_runtime(verbose: bool = False) -> tuple[bool, dict]:
-    """Check runtime dependencies (D7)."""
+# Shared keep-alive session for the reachability probes; see _http_session().
+_SESSION: requests.Session | None = None
+
+
+def _http_session() -> requests.Session:
+    """Return the pooled session used for HEAD reachability probes.
+
+    --all-profiles probes one URL per profile, and profiles commonly share a
+    Jira host (one per project set), so a single pooled session reuses the
+    TCP/TLS connection instead of handshaking for every profile.
+    """
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        # A flaky handshake or gateway hiccup gets a quick second try instead
+        # of reporting the profile as down; the last status is kept, not raised
+        retry = Retry(
+            total=2, connect=2, read=1, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=PROBE_WORKERS, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def check_runtime(verbose: bool = False, report_versions: bool | None = None) -> tuple[bool, dict]:
+    """Check runtime dependencies (D7).
+
+    ``uv --version`` costs a process spawn, so it only runs when the version
+    is actually reported (``report_versions``, default: ``verbose``).
+    """
     checks_passed = True
     info = {}
+    if report_versions is None:
+        report_versions = verbose
 
     # Check uv/uvx
     uv_path = shutil.which("uv")
     if uv_path:
-        result = subprocess.run(["uv", "--version"], capture_output=True, text=True)  # nosec B603 B607
-        uv_version = result.stdout.strip() if result.returncode == 0 else "unknown"
         info["uv_path"] = uv_path
-        info["uv_version"] = uv_version
-        if verbose:
-            success(f"uv found: {uv_path} ({uv_version})")
+        if report_versions:
+            import subprocess  # only needed here; keeps the common path import-free
+
+            result = subprocess.run([uv_path, "--version"], capture_output=True, text=True)  # nosec B603
+            uv_version = result.stdout.strip() if result.returncode == 0 else "unknown"
+            info["uv_version"] = uv_version
+            if verbose:
+                success(f"uv found: {uv_path} ({uv_version})")
     else:
         error(
             "Runtime check failed: 'uv' command not found",
@@ -137,32 +178,53 @@ def check_environment(env_file: str | None, profile: str | None = None, verbose:
         return None
 
 
-def check_connectivity(
-    config: dict, project: str | None, profile: str | None = None, env_file: str | None = None, verbose: bool = False
-) -> tuple[bool, dict]:
+def _fetch_server_info(url: str) -> dict:
+    """GET serverInfo once and return its JSON body ({} if there is none).
+
+    Any HTTP answer counts as reachable, like the HEAD probe this replaced;
+    serverInfo is served anonymously, so no credentials are sent. Plain
+    requests.get() makes exactly one attempt (no connect retries) within
+    SERVER_INFO_TIMEOUT.
+    """
+    response = requests.get(f"{url.rstrip('/')}/rest/api/2/serverInfo", timeout=SERVER_INFO_TIMEOUT)
+    if response.status_code != 200:
+        return {}
+    try:
+        return response.json()
+    except ValueError:
+        return {}
+
+
+def check_connectivity(config: dict, project: str | None, verbose: bool = False) -> tuple[bool, dict]:
     """Check connectivity and authentication."""
     url = config["JIRA_URL"]
     info = {"url": url}
 
-    # Test server reachability
+    # Test server reachability with a single short request; the client's own
+    # session retries connect errors and waits JIRA_TIMEOUT per attempt, which
+    # would leave an unreachable host blocking validation for minutes
     try:
-        response = requests.head(url, timeout=10, allow_redirects=True)
+        server = _fetch_server_info(url)
         info["server_reachable"] = True
         if verbose:
-            success(f"Server reachable: {url} (status: {response.status_code})")
+            success(f"Server reachable: {url} (Jira {server.get('version', 'unknown version')})")
     except requests.exceptions.Timeout:
         error(
             f"Connection timeout: {url}",
-            "The server did not respond within 10 seconds.\n  Check your network connection and JIRA_URL.",
+            f"The server did not respond within {SERVER_INFO_TIMEOUT} seconds.\n"
+            "  Check your network connection and JIRA_URL.",
         )
         return False, info
     except requests.exceptions.ConnectionError as e:
         error(f"Connection failed: {url}", f"Could not connect to the server.\n  Error: {_sanitize_error(str(e))}")
         return False, info
+    except Exception as e:
+        error(f"Connection failed: {url}", f"Could not query server info.\n  Error: {_sanitize_error(str(e))}")
+        return False, info
 
-    # Test authentication
+    # Test authentication; project access below reuses the client's session
+    client = LazyJiraClient(config=config)
     try:
-        client = LazyJiraClient(env_file=env_file, profile=profile)
         user = client.myself()
         display_name = user.get("displayName", user.get("name", "Unknown"))
         email = user.get("emailAddress", "N/A")
@@ -200,6 +262,17 @@ def check_connectivity(
     return True, info
 
 
+def _probe_status(url: str) -> str:
+    """HEAD-probe a profile URL and return its --all-profiles status cell."""
+    try:
+        response = _http_session().head(url, timeout=PROBE_TIMEOUT, allow_redirects=True)
+    except Exception:
+        return "UNREACHABLE"
+    if response.status_code < 400 or response.status_code in (401, 403):
+        return "OK"
+    return f"HTTP {response.status_code}"
+
+
 def validate_all_profiles(output_json: bool = False, verbose: bool = False) -> int:
     """Validate all profiles in ~/.jira/profiles.json.
 
@@ -215,6 +288,7 @@ def validate_all_profiles(output_json: bool = False, verbose: bool = False) -> i
     profiles = data["profiles"]
     default_name = data.get("default", "")
     results = []
+    probes = []
 
     for name, prof in profiles.items():
         row = {
@@ -238,20 +312,19 @@ def validate_all_profiles(output_json: bool = False, verbose: bool = False) -> i
             results.append(row)
             continue
 
-        # Quick connectivity check
-        try:
-            response = requests.head(config["JIRA_URL"], timeout=5, allow_redirects=True)
-            if response.status_code < 400 or response.status_code in (401, 403):
-                row["Status"] = "OK"
-            else:
-                row["Status"] = f"HTTP {response.status_code}"
-        except Exception:
-            row["Status"] = "UNREACHABLE"
-
+        row["Status"] = None
+        probes.append((row, config["JIRA_URL"]))
         results.append(row)
 
+    # Quick connectivity checks, run concurrently on the shared pooled session
+    if probes:
+        with ThreadPoolExecutor(max_workers=min(len(probes), PROBE_WORKERS)) as pool:
+            statuses = pool.map(_probe_status, [url for _, url in probes])
+            for (row, _), status in zip(probes, statuses, strict=True):
+                row["Status"] = status
+
     if output_json:
-        print(json_module.dumps(results, indent=2))
+        print(format_json(results))
     else:
         click.echo(f"Profiles from {PROFILES_FILE}:\n")
         print(format_table(results, ["Profile", "URL", "Auth", "Projects", "Status", "Default"]))
@@ -270,6 +343,22 @@ def validate_all_profiles(output_json: bool = False, verbose: bool = False) -> i
     return EXIT_SUCCESS
 
 
+def _emit_result(result: dict, output_json: bool, quiet: bool) -> None:
+    """Print the final result for --json / --quiet (verbose output is printed as it goes)."""
+    if output_json:
+        print(format_json(result))
+    elif quiet:
+        print(result["status"])
+
+
+def _fail(result: dict, error_code: str, exit_code: int, output_json: bool, quiet: bool) -> NoReturn:
+    """Record a failed check in *result*, emit it and exit with *exit_code*."""
+    result["status"] = "error"
+    result["error"] = error_code
+    _emit_result(result, output_json, quiet)
+    sys.exit(exit_code)
+
+
 @click.command()
 @click.option("--json", "output_json", is_flag=True, help="Output as JSON")
 @click.option("--quiet", "-q", is_flag=True, help="Minimal output")
@@ -278,6 +367,7 @@ def validate_all_profiles(output_json: bool = False, verbose: bool = False) -> i
 @click.option("--env-file", type=click.Path(exists=False), help="Path to environment file")
 @click.option("--profile", "-P", help="Validate a specific profile from ~/.jira/profiles.json")
 @click.option("--all-profiles", is_flag=True, help="Validate all profiles in ~/.jira/profiles.json")
+@click.option("--offline", is_flag=True, help="Only check runtime and configuration; skip all network checks")
 @click.option("--debug", is_flag=True, help="Show debug information on errors")
 def main(
     output_json: bool,
@@ -287,6 +377,7 @@ def main(
     env_file: str | None,
     profile: str | None,
     all_profiles: bool,
+    offline: bool,
     debug: bool,
 ):
     """Validate Jira environment configuration.
@@ -301,6 +392,9 @@ def main(
       2 - Environment configuration error
       3 - Connectivity/authentication failure
 
+    --offline stops after the configuration check, e.g. to gate a CI job on
+    a parseable config without a Jira round-trip.
+
     \b
     Examples:
       # Validate default configuration
@@ -311,7 +405,13 @@ def main(
 
       # Validate all profiles
       uv run scripts/core/jira-validate.py --all-profiles
+
+      # Configuration only, no network access
+      uv run scripts/core/jira-validate.py --offline --quiet
     """
+    if offline and (all_profiles or project):
+        raise click.UsageError("--offline cannot be combined with --all-profiles or --project (both need the network)")
+
     # Handle --all-profiles mode
     if all_profiles:
         exit_code = validate_all_profiles(output_json=output_json, verbose=verbose)
@@ -322,43 +422,22 @@ def main(
     # Suppress verbose output if JSON or quiet mode
     show_verbose = verbose and not output_json and not quiet
 
+    # Check 1: Runtime (banner and section header go out in one write)
     if show_verbose:
-        click.echo("=" * 60)
-        if profile:
-            click.echo(f"Jira Environment Validation (profile: {profile})")
-        else:
-            click.echo("Jira Environment Validation")
-        click.echo("=" * 60)
-        click.echo()
-
-    # Check 1: Runtime
-    if show_verbose:
-        click.echo("Runtime Checks:")
-    runtime_ok, runtime_info = check_runtime(show_verbose)
+        title = f"Jira Environment Validation (profile: {profile})" if profile else "Jira Environment Validation"
+        rule = "=" * 60
+        click.echo(f"{rule}\n{title}\n{rule}\n\nRuntime Checks:")
+    runtime_ok, runtime_info = check_runtime(show_verbose, report_versions=show_verbose or output_json)
     result["runtime"] = runtime_info
     if not runtime_ok:
-        result["status"] = "error"
-        result["error"] = "runtime_check_failed"
-        if output_json:
-            print(json_module.dumps(result, indent=2))
-        elif quiet:
-            print("error")
-        sys.exit(EXIT_RUNTIME_ERROR)
-    if show_verbose:
-        click.echo()
+        _fail(result, "runtime_check_failed", EXIT_RUNTIME_ERROR, output_json, quiet)
 
     # Check 2: Environment
     if show_verbose:
-        click.echo("Environment Checks:")
+        click.echo("\nEnvironment Checks:")
     config = check_environment(env_file, profile, show_verbose)
     if config is None:
-        result["status"] = "error"
-        result["error"] = "config_error"
-        if output_json:
-            print(json_module.dumps(result, indent=2))
-        elif quiet:
-            print("error")
-        sys.exit(EXIT_CONFIG_ERROR)
+        _fail(result, "config_error", EXIT_CONFIG_ERROR, output_json, quiet)
 
     if profile:
         result["profile"] = profile
@@ -368,35 +447,30 @@ def main(
     result["auth_mode"] = auth_mode
     if auth_mode == "cloud":
         result["username"] = config.get("JIRA_USERNAME", "N/A")
-    if show_verbose:
-        click.echo()
 
     # Check 3: Connectivity
+    if offline:
+        result["connectivity"] = "skipped"
+        if output_json or quiet:
+            _emit_result(result, output_json, quiet)
+        else:
+            success("Configuration checks passed (connectivity not checked: --offline)")
+        sys.exit(EXIT_SUCCESS)
     if show_verbose:
-        click.echo("Connectivity Checks:")
-    conn_ok, conn_info = check_connectivity(config, project, profile=profile, env_file=env_file, verbose=show_verbose)
+        click.echo("\nConnectivity Checks:")
+    conn_ok, conn_info = check_connectivity(config, project, verbose=show_verbose)
     result["user"] = conn_info.get("user", "Unknown")
     if "project_access" in conn_info:
         result["project_access"] = conn_info["project_access"]
     if not conn_ok:
-        result["status"] = "error"
-        result["error"] = "connectivity_error"
-        if output_json:
-            print(json_module.dumps(result, indent=2))
-        elif quiet:
-            print("error")
-        sys.exit(EXIT_CONNECTION_ERROR)
-    if show_verbose:
-        click.echo()
+        _fail(result, "connectivity_error", EXIT_CONNECTION_ERROR, output_json, quiet)
 
     # All passed
-    if output_json:
-        print(json_module.dumps(result, indent=2))
-    elif quiet:
-        print("ok")
+    if output_json or quiet:
+        _emit_result(result, output_json, quiet)
     else:
         if show_verbose:
-            click.echo("=" * 60)
+            click.echo("\n" + "=" * 60)
         success("All validation checks passed!")
     sys.exit(EXIT_SUCCESS)
 
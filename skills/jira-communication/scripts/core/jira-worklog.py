@@ -8,17 +8,16 @@
 # ///
 """Jira worklog operations - add and list time tracking entries."""
 
+import csv
+import os
 import sys
+from collections.abc import Iterator
 from datetime import datetime
-from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Shared library import (TR1.1.1 - PYTHONPATH approach)
 # ═══════════════════════════════════════════════════════════════════════════════
-_script_dir = Path(__file__).parent
-_lib_path = _script_dir.parent / "lib"
-if _lib_path.exists():
-    sys.path.insert(0, str(_lib_path.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import re
 
@@ -26,6 +25,17 @@ import click
 from lib.client import LazyJiraClient
 from lib.output import comment_to_text, error, format_output, success
 
+_JIRA_TS_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}[+-]\d{4}$")
+_DATE_ONLY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_TZ_COLON_RE = re.compile(r"([+-])(\d{2}):(\d{2})$")
+_NO_SEC_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}$")
+_SEC_NO_MS_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$")
+
+
+def _local_tz_offset() -> str:
+    """Return the current local UTC offset in Jira's compact form (e.g. +0100)."""
+    return datetime.now().astimezone().strftime("%z")
+
 
 def normalize_iso_timestamp(timestamp: str) -> str:
     """Normalize ISO timestamp to Jira's required format.
@@ -40,36 +50,51 @@ def normalize_iso_timestamp(timestamp: str) -> str:
       - 2025-01-15T09:00:00.000+0100 (pass through)
     """
     # Already in Jira format (has milliseconds and compact timezone)
-    if re.match(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}[+-]\d{4}$", timestamp):
+    if _JIRA_TS_RE.match(timestamp):
         return timestamp
 
-    # Get local timezone offset
-    local_tz = datetime.now().astimezone().strftime("%z")  # e.g., +0100
-
     # Date only: 2025-01-15
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", timestamp):
-        return f"{timestamp}T00:00:00.000{local_tz}"
+    if _DATE_ONLY_RE.match(timestamp):
+        return f"{timestamp}T00:00:00.000{_local_tz_offset()}"
 
-    # Has timezone with colon: 2025-01-15T09:00:00+01:00
-    tz_match = re.search(r"([+-])(\d{2}):(\d{2})$", timestamp)
+    # Has timezone with colon: 2025-01-15T09:00:00+01:00; otherwise use the
+    # local offset (only looked up when the input carries no timezone)
+    tz_match = _TZ_COLON_RE.search(timestamp)
     if tz_match:
         tz_compact = f"{tz_match.group(1)}{tz_match.group(2)}{tz_match.group(3)}"
         timestamp = timestamp[: tz_match.start()]
     else:
-        tz_compact = local_tz
+        tz_compact = _local_tz_offset()
 
     # No seconds: 2025-01-15T09:00
-    if re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}$", timestamp):
+    if _NO_SEC_RE.match(timestamp):
         timestamp = f"{timestamp}:00"
 
     # Has seconds but no milliseconds: 2025-01-15T09:00:00
-    if re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$", timestamp):
+    if _SEC_NO_MS_RE.match(timestamp):
         return f"{timestamp}.000{tz_compact}"
 
     # Fallback: return as-is (let Jira API handle/reject it)
     return timestamp
 
 
+def _build_worklog(time_spent: str, comment: str | None, started: str | None) -> dict:
+    """Build the JSON body for a new worklog (``started`` defaults to now)."""
+    worklog_data = {
+        "timeSpent": time_spent,
+    }
+
+    if comment:
+        worklog_data["comment"] = comment
+
+    if started:
+        worklog_data["started"] = normalize_iso_timestamp(started)
+    else:
+        # Default to current time in local timezone (Jira format)
+        worklog_data["started"] = datetime.now().astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
+    return worklog_data
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CLI Definition
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -122,22 +147,8 @@ def add(ctx, issue_key: str, time_spent: str, comment: str | None, started: str
     client = ctx.obj["client"]
 
     try:
-        # Build worklog data for JSON API
-        worklog_data = {
-            "timeSpent": time_spent,
-        }
-
-        if comment:
-            worklog_data["comment"] = comment
-
-        if started:
-            worklog_data["started"] = normalize_iso_timestamp(started)
-        else:
-            # Default to current time in local timezone (Jira format)
-            worklog_data["started"] = datetime.now().astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
-
         # Add worklog via REST API (using issue_add_json_worklog which accepts timeSpent string)
-        result = client.issue_add_json_worklog(issue_key, worklog_data)
+        result = client.issue_add_json_worklog(issue_key, _build_worklog(time_spent, comment, started))
 
         if ctx.obj["quiet"]:
             print(result.get("id", "ok"))
@@ -156,6 +167,68 @@ def add(ctx, issue_key: str, time_spent: str, comment: str | None, started: str
         sys.exit(1)
 
 
+@cli.command("add-batch")
+@click.argument("entries", type=click.File("r", encoding="utf-8"))
+@click.pass_context
+def add_batch(ctx, entries):
+    """Add many worklog entries from a CSV file over one connection.
+
+    ENTRIES: CSV file ("-" for stdin), one entry per line:
+    ISSUE_KEY,TIME_SPENT[,STARTED[,COMMENT]]. Blank lines and lines
+    starting with '#' are skipped. All entries must belong to the Jira
+    instance of the first issue key.
+
+    Every line is checked before anything is booked; a booking that fails
+    is reported and the remaining lines are still added.
+
+    Examples:
+
+      jira-worklog add-batch timesheet.csv
+
+      printf 'PROJ-1,2h,2025-01-15T09:00,Review\\n' | jira-worklog add-batch -
+    """
+    rows = []
+    for line_no, row in enumerate(csv.reader(entries), 1):
+        if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+            continue
+        fields = [f.strip() for f in row]
+        if len(fields) < 2 or not fields[1] or len(fields) > 4:
+            error(f"Line {line_no}: expected ISSUE_KEY,TIME_SPENT[,STARTED[,COMMENT]]")
+            sys.exit(1)
+        issue_key, time_spent, started, comment = (fields + ["", ""])[:4]
+        rows.append((issue_key, time_spent, started or None, comment or None))
+
+    if not rows:
+        error("No worklog entries found")
+        sys.exit(1)
+
+    ctx.obj["client"].with_context(issue_key=rows[0][0])
+    client = ctx.obj["client"]
+
+    results = []
+    failed = 0
+    for issue_key, time_spent, started, comment in rows:
+        try:
+            result = client.issue_add_json_worklog(issue_key, _build_worklog(time_spent, comment, started))
+        except Exception as e:
+            if ctx.obj["debug"]:
+                raise
+            failed += 1
+            error(f"Failed to add worklog to {issue_key}: {e}")
+            results.append({"issue": issue_key, "timeSpent": time_spent, "error": str(e)})
+            continue
+        results.append({"issue": issue_key, "timeSpent": time_spent, "id": result.get("id")})
+        if ctx.obj["quiet"]:
+            print(result.get("id", "ok"))
+        elif not ctx.obj["json"]:
+            success(f"Added worklog to {issue_key}: {time_spent} (id {result.get('id', 'N/A')})")
+
+    if ctx.obj["json"]:
+        format_output(results, as_json=True)
+    if failed:
+        sys.exit(1)
+
+
 @cli.command("list")
 @click.argument("issue_key")
 @click.option("--limit", "-n", default=10, help="Max entries to show")
@@ -176,35 +249,18 @@ def list_worklogs(ctx, issue_key: str, limit: int, truncate: int | None):
     client = ctx.obj["client"]
 
     try:
-        result = client.issue_get_worklog(issue_key)
-        worklogs = result.get("worklogs", [])
-
-        # Newest first, then limit
-        worklogs = list(reversed(worklogs))[:limit]
+        # Newest first
+        worklogs = list(reversed(_fetch_latest_worklogs(client, issue_key, limit)))
 
         if ctx.obj["json"]:
             format_output(worklogs, as_json=True)
         elif ctx.obj["quiet"]:
-            for wl in worklogs:
-                print(wl.get("id", ""))
+            sys.stdout.write("".join(f"{wl.get('id', '')}\n" for wl in worklogs))
+        elif not worklogs:
+            print(f"No worklogs found for {issue_key}")
         else:
-            if not worklogs:
-                print(f"No worklogs found for {issue_key}")
-            else:
-                print(f"Worklogs for {issue_key} ({len(worklogs)} shown):\n")
-                for wl in worklogs:
-                    author = wl.get("author", {}).get("displayName", "Unknown")
-                    time_spent = wl.get("timeSpent", "N/A")
-                    started = wl.get("started", "N/A")[:10] if wl.get("started") else "N/A"
-                    worklog_id = wl.get("id", "N/A")
-                    comment = comment_to_text(wl.get("comment"))
-
-                    print(f"  [{started}] {author}: {time_spent}  (id {worklog_id})")
-                    if comment:
-                        # Truncate if requested
-                        if truncate and len(comment) > truncate:
-                            comment = comment[: truncate - 3] + "..."
-                        print(f"           {comment}")
+            print(f"Worklogs for {issue_key} ({len(worklogs)} shown):\n")
+            sys.stdout.write("".join(_worklog_lines(worklogs, truncate)))
 
     except Exception as e:
         if ctx.obj["debug"]:
@@ -213,6 +269,54 @@ def list_worklogs(ctx, issue_key: str, limit: int, truncate: int | None):
         sys.exit(1)
 
 
+def _worklog_lines(worklogs: list[dict], truncate: int | None) -> Iterator[str]:
+    """Yield the newline-terminated display lines of ``list`` for *worklogs*."""
+    keep = truncate - 3 if truncate else 0
+    for wl in worklogs:
+        author = (wl.get("author") or {}).get("displayName", "Unknown")
+        started = wl.get("started")
+        comment = comment_to_text(wl.get("comment"))
+
+        yield f"  [{started[:10] if started else 'N/A'}] {author}: {wl.get('timeSpent', 'N/A')}  (id {wl.get('id', 'N/A')})\n"
+        if comment:
+            # Truncate if requested
+            if truncate and len(comment) > truncate:
+                comment = comment[:keep] + "..."
+            yield f"           {comment}\n"
+
+
+def _fetch_latest_worklogs(client, issue_key: str, limit: int) -> list[dict]:
+    """Return the newest *limit* worklogs of an issue, oldest first.
+
+    Jira returns worklogs oldest first, so instead of downloading the whole
+    history this reads the first page (which is everything for most issues)
+    and, when ``total`` says there is more, pages forward from the start of
+    the last *limit* entries. Servers may cap ``maxResults`` below *limit*,
+    so the tail can take several pages. Servers that ignore
+    ``startAt``/``maxResults`` return the full list, which the final slice
+    handles the same way.
+    """
+    path = f"rest/api/2/issue/{issue_key}/worklog"
+    page = client.get(path, params={"startAt": 0, "maxResults": limit}) or {}
+    worklogs = page.get("worklogs", [])
+    total = page.get("total", len(worklogs))
+    if total > len(worklogs):
+        start = max(0, total - limit)
+        if start < len(worklogs):
+            # The first page already reaches into the tail; keep that part
+            worklogs, start = worklogs[start:], len(worklogs)
+        else:
+            worklogs = []
+        while start < total:
+            page = client.get(path, params={"startAt": start, "maxResults": total - start}) or {}
+            batch = page.get("worklogs", [])
+            if not batch:
+                break
+            worklogs.extend(batch)
+            start += len(batch)
+    return worklogs[-limit:] if limit > 0 else []
+
+
 @cli.command()
 @click.argument("issue_key")
 @click.argument("worklog_id")
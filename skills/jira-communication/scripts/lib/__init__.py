@@ -1,19 +1,47 @@
-"""Shared utilities for Jira CLI scripts."""
-
-from .client import LazyJiraClient, get_jira_client, is_account_id
-from .config import (
-    get_auth_mode,
-    load_config,
-    load_env,
-    load_profiles,
-    profile_to_config,
-    resolve_profile,
-    validate_config,
-)
-from .output import extract_adf_text, format_json, format_output, format_table
+"""Shared utilities for Jira CLI scripts.
+
+Re-exports are resolved lazily (PEP 562): ``from lib.output import ...``
+must not drag in ``lib.client`` and its requests/urllib3 imports.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import LazyJiraClient, get_jira_client, get_jira_client_from_config, is_account_id
+    from .config import (
+        get_auth_mode,
+        load_config,
+        load_env,
+        load_profiles,
+        profile_to_config,
+        resolve_profile,
+        validate_config,
+    )
+    from .output import extract_adf_text, format_json, format_output, format_table, stream_table
+
+_EXPORTS = {
+    "get_jira_client": "client",
+    "get_jira_client_from_config": "client",
+    "LazyJiraClient": "client",
+    "is_account_id": "client",
+    "load_env": "config",
+    "load_config": "config",
+    "load_profiles": "config",
+    "resolve_profile": "config",
+    "profile_to_config": "config",
+    "validate_config": "config",
+    "get_auth_mode": "config",
+    "format_output": "output",
+    "format_json": "output",
+    "format_table": "output",
+    "stream_table": "output",
+    "extract_adf_text": "output",
+}
 
 __all__ = [
     "get_jira_client",
+    "get_jira_client_from_config",
     "LazyJiraClient",
     "is_account_id",
     "load_env",
@@ -26,5 +54,19 @@ __all__ = [
     "format_output",
     "format_json",
     "format_table",
+    "stream_table",
     "extract_adf_text",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
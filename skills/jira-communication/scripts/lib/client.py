@@ -1,18 +1,47 @@
 """Jira client initialization for CLI scripts."""
 
+import hashlib
 import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-from atlassian import Jira
 from requests import Response
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .config import get_auth_mode, is_cloud_url, load_config, validate_config
+from .config import (
+    CLOUD_VARS,
+    REQUIRED_URL,
+    SERVER_VARS,
+    URL_SCHEMES,
+    get_auth_mode,
+    is_cloud_url,
+    load_config,
+    validate_config,
+)
+
+if TYPE_CHECKING:
+    from atlassian import Jira
+else:
+    # Imported on first use by _jira_class(): the atlassian package also loads
+    # its Confluence/Bitbucket/... modules and dominates script start-up time,
+    # which --help and argument errors never need.
+    Jira = None
 
 # Default timeout for all Jira API requests (seconds)
 JIRA_TIMEOUT = 30
 
+# Keep-alive connections kept per host; sized for concurrent page fetches
+# (jira-search --workers) so parallel requests never open throwaway sockets
+HTTP_POOL_SIZE = 20
+
+# On-disk HTTP cache for --cache-ttl (requires the optional requests-cache package)
+HTTP_CACHE_DIR = Path.home() / ".cache" / "jira-skill"
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Account ID detection (Jira Cloud)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -250,6 +279,10 @@ class AuthenticationError(Exception):
     """
 
 
+# "CAPTCHA_CHALLENGE; login-url=https://jira.example.com/login.jsp"
+_CAPTCHA_LOGIN_URL_RE = re.compile(r"; login-url=(\S+)")
+
+
 def _check_captcha_challenge(response: Response, jira_url: str) -> None:
     """Check response for CAPTCHA challenge and raise exception if found.
 
@@ -264,18 +297,17 @@ def _check_captcha_challenge(response: Response, jira_url: str) -> None:
     Raises:
         CaptchaError: If CAPTCHA challenge is detected
     """
-    header_name = "X-Authentication-Denied-Reason"
-    if header_name not in response.headers:
+    # Runs on every response: one header lookup, no allocation when absent
+    header_value = response.headers.get("X-Authentication-Denied-Reason")
+    if header_value is None or "CAPTCHA_CHALLENGE" not in header_value:
         return
 
-    header_value = response.headers[header_name]
-    if "CAPTCHA_CHALLENGE" not in header_value:
-        return
-
-    # Extract login URL if present in header, but validate it matches jira_url host
+    # Extract login URL if present in header, but validate it matches jira_url host.
+    # Keep this order: urlparse only runs once the regex found a login-url.
     login_url = f"{jira_url}/login.jsp"
-    if "; login-url=" in header_value:
-        candidate = header_value.split("; login-url=")[1].strip()
+    match = _CAPTCHA_LOGIN_URL_RE.search(header_value)
+    if match:
+        candidate = match.group(1)
         # Only use the header URL if its host matches the configured Jira host
         candidate_host = urlparse(candidate).netloc.lower()
         jira_host = urlparse(jira_url).netloc.lower()
@@ -389,6 +421,55 @@ def _patch_session_for_response_validation(client: Jira, jira_url: str) -> None:
     client._session.request = patched_request
 
 
+class _RateLimitPacer:
+    """Space out requests once Jira reports an empty rate-limit bucket.
+
+    Jira Cloud sends ``X-RateLimit-Remaining``, ``X-RateLimit-FillRate`` and
+    ``X-RateLimit-Interval-Seconds``. When the bucket is empty, the next
+    request from any thread sharing the session waits for one token to
+    refill instead of drawing a 429 and a Retry-After back-off.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._not_before = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._not_before - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, headers) -> None:
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining"))
+            fill_rate = float(headers.get("X-RateLimit-FillRate"))
+            interval = float(headers.get("X-RateLimit-Interval-Seconds"))
+        except (TypeError, ValueError):
+            return  # Server/DC without rate-limit headers, or malformed values
+        if remaining > 0 or fill_rate <= 0 or interval <= 0:
+            return
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic() + interval / fill_rate)
+
+
+def _patch_session_for_rate_limit_pacing(client: Jira) -> None:
+    """Wrap the session so requests honour Jira's X-RateLimit-* headers."""
+    pacer = _RateLimitPacer()
+    original_request = client._session.request
+
+    def paced_request(method: str, url: str, **kwargs) -> Response:
+        pacer.wait()
+        response = original_request(method, url, **kwargs)
+        # A requests-cache hit replays the headers of an old response; its
+        # X-RateLimit-* values say nothing about the bucket right now
+        if not getattr(response, "from_cache", False):
+            pacer.update(response.headers)
+        return response
+
+    client._session.request = paced_request
+
+
 class LazyJiraClient:
     """Deferred Jira client that supports issue-key/URL-based profile resolution.
 
@@ -418,12 +499,24 @@ class LazyJiraClient:
     _CLOUD_DRAIN_HARDCAP = 1000
     _CLOUD_SEARCH_ENDPOINT = "rest/api/3/search/jql"
 
-    def __init__(self, env_file: str | None = None, profile: str | None = None):
-        object.__setattr__(self, "_env_file", env_file)
-        object.__setattr__(self, "_profile", profile)
-        object.__setattr__(self, "_issue_key", None)
-        object.__setattr__(self, "_url", None)
-        object.__setattr__(self, "_client", None)
+    # Slots keep instances dict-free; every slot is set in __init__, so
+    # __getattr__ only fires for names forwarded to the real client.
+    __slots__ = ("_env_file", "_config", "_profile", "_cache_ttl", "_issue_key", "_url", "_client")
+
+    def __init__(
+        self,
+        env_file: str | None = None,
+        profile: str | None = None,
+        cache_ttl: int = 0,
+        config: dict | None = None,
+    ):
+        self._env_file = env_file
+        self._config = config
+        self._profile = profile
+        self._cache_ttl = cache_ttl
+        self._issue_key = None
+        self._url = None
+        self._client = None
 
     def with_context(self, issue_key: str | None = None, url: str | None = None):
         """Set resolution context for automatic profile matching.
@@ -434,27 +527,47 @@ class LazyJiraClient:
         If *issue_key* looks like a URL (starts with http(s)://), it is
         also used as *url* for host-based profile resolution.
         """
-        if object.__getattribute__(self, "_client") is None:
+        if self._client is None:
             if issue_key is not None:
-                object.__setattr__(self, "_issue_key", issue_key)
+                self._issue_key = issue_key
                 # Detect URL passed as issue_key → enable host-based resolution
-                if url is None and issue_key.startswith(("http://", "https://")):
-                    object.__setattr__(self, "_url", issue_key)
+                if url is None and issue_key.startswith(URL_SCHEMES):
+                    self._url = issue_key
             if url is not None:
-                object.__setattr__(self, "_url", url)
+                self._url = url
+        return self
+
+    def without_cache(self):
+        """Bypass the ``cache_ttl`` response cache for this client.
+
+        Must be called before the first API call. Has no effect if the
+        client is already initialized.
+        """
+        if self._client is None:
+            self._cache_ttl = 0
         return self
 
     def _ensure_client(self) -> Jira:
         """Lazy-create the underlying Jira client on first use."""
-        client = object.__getattribute__(self, "_client")
+        client = self._client
         if client is None:
-            client = get_jira_client(
-                env_file=object.__getattribute__(self, "_env_file"),
-                profile=object.__getattribute__(self, "_profile"),
-                issue_key=object.__getattribute__(self, "_issue_key"),
-                url=object.__getattribute__(self, "_url"),
-            )
-            object.__setattr__(self, "_client", client)
+            extra = {}
+            cache_ttl = self._cache_ttl
+            if cache_ttl:
+                extra["cache_ttl"] = cache_ttl
+            config = self._config
+            if config is not None:
+                # Caller already loaded the config; don't re-read it from disk
+                client = get_jira_client_from_config(config, **extra)
+            else:
+                client = get_jira_client(
+                    env_file=self._env_file,
+                    profile=self._profile,
+                    issue_key=self._issue_key,
+                    url=self._url,
+                    **extra,
+                )
+            self._client = client
         return client
 
     def __getattr__(self, name):
@@ -577,8 +690,67 @@ class LazyJiraClient:
         }
 
 
+def _response_cache_name(config: dict) -> str:
+    """Return the cache database path for the configured URL and credentials.
+
+    requests-cache redacts the Authorization header before building its cache
+    keys, so separate databases are what keep two profiles or tokens on the
+    same host from reading each other's responses.
+    """
+    identity = "\0".join(config.get(var) or "" for var in (REQUIRED_URL, *CLOUD_VARS, *SERVER_VARS))
+    digest = hashlib.sha256(identity.encode()).hexdigest()[:16]
+    return str(HTTP_CACHE_DIR / f"http_cache-{digest}")
+
+
+def _install_response_cache(client: Jira, ttl: int, config: dict) -> bool:
+    """Replace the client session with a requests-cache CachedSession.
+
+    Only successful GET responses are cached, for *ttl* seconds. Each set of
+    credentials gets its own cache database (see ``_response_cache_name``).
+
+    Returns:
+        False if requests-cache is not installed (the client is left as is).
+    """
+    try:
+        import requests_cache
+    except ImportError:
+        return False
+
+    HTTP_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    session = requests_cache.CachedSession(
+        cache_name=_response_cache_name(config),
+        backend="sqlite",
+        expire_after=ttl,
+        allowable_methods=("GET",),
+        allowable_codes=(200,),
+        match_headers=["Accept"],
+    )
+    old_session = client._session
+    session.headers.update(old_session.headers)
+    session.auth = old_session.auth
+    session.cookies.update(old_session.cookies)
+    session.verify = old_session.verify
+    session.proxies.update(old_session.proxies)
+    client._session = session
+    return True
+
+
+def _jira_class() -> type[Jira]:
+    """Return atlassian.Jira, importing it on the first call."""
+    global Jira
+    if Jira is None:
+        from atlassian import Jira as jira_cls
+
+        Jira = jira_cls
+    return Jira
+
+
 def get_jira_client(
-    env_file: str | None = None, profile: str | None = None, issue_key: str | None = None, url: str | None = None
+    env_file: str | None = None,
+    profile: str | None = None,
+    issue_key: str | None = None,
+    url: str | None = None,
+    cache_ttl: int = 0,
 ) -> Jira:
     """Initialize and return a Jira client.
 
@@ -594,6 +766,8 @@ def get_jira_client(
         profile: Optional profile name from ~/.jira/profiles.json
         issue_key: Optional issue key for automatic profile resolution
         url: Optional Jira URL for automatic profile resolution
+        cache_ttl: Cache successful GET responses on disk for this many
+            seconds (0 disables; needs the optional requests-cache package)
 
     Returns:
         Configured Jira client instance
@@ -604,7 +778,27 @@ def get_jira_client(
         ConnectionError: If cannot connect to Jira
     """
     config = load_config(profile=profile, env_file=env_file, issue_key=issue_key, url=url)
+    return get_jira_client_from_config(config, cache_ttl=cache_ttl)
+
+
+def get_jira_client_from_config(config: dict, cache_ttl: int = 0) -> Jira:
+    """Build a Jira client from an already-loaded configuration dict.
+
+    Lets callers that have loaded (and possibly reported on) the config
+    themselves, like ``jira-validate``, skip a second read of the env file
+    or profiles.json.
 
+    Args:
+        config: Configuration as returned by ``load_config``
+        cache_ttl: See ``get_jira_client``
+
+    Returns:
+        Configured Jira client instance
+
+    Raises:
+        ValueError: If configuration is invalid
+        ConnectionError: If cannot connect to Jira
+    """
     errors = validate_config(config)
     if errors:
         raise ValueError("Configuration errors:\n  " + "\n  ".join(errors))
@@ -617,10 +811,11 @@ def get_jira_client(
     if "JIRA_CLOUD" not in config:
         is_cloud = is_cloud_url(jira_url)
 
+    jira_cls = _jira_class()
     try:
         if auth_mode == "pat":
             # Server/DC with Personal Access Token
-            client = Jira(
+            client = jira_cls(
                 url=jira_url,
                 token=config["JIRA_PERSONAL_TOKEN"],
                 cloud=is_cloud,
@@ -628,7 +823,7 @@ def get_jira_client(
             )
         else:
             # Cloud with username + API token
-            client = Jira(
+            client = jira_cls(
                 url=jira_url,
                 username=config["JIRA_USERNAME"],
                 password=config["JIRA_API_TOKEN"],
@@ -636,18 +831,24 @@ def get_jira_client(
                 timeout=JIRA_TIMEOUT,
             )
 
-        # Mount retry adapter for rate limiting (HTTP 429) and transient errors
+        if cache_ttl > 0 and not _install_response_cache(client, cache_ttl, config):
+            print("⚠ --cache-ttl ignored: requests-cache is not installed", file=sys.stderr)
+
+        # Mount retry adapter for rate limiting (HTTP 429) and transient errors;
+        # a 429/503 Retry-After header overrides the exponential back-off
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
+            total=5,
+            backoff_factor=0.5,
             status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=True,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE, max_retries=retry_strategy)
         client._session.mount("https://", adapter)
         client._session.mount("http://", adapter)
 
         # Patch session to run response validation (CAPTCHA, authentication failures, session-expiry HTML pages)
         _patch_session_for_response_validation(client, jira_url)
+        _patch_session_for_rate_limit_pacing(client)
 
         return client
     except CaptchaError:
@@ -675,6 +876,21 @@ def get_jira_client(
             ) from e
 
 
+# "Authorization: <scheme> <token>" is redacted as one unit; the lookahead
+# keeps e.g. "basic " from consuming a following "Authorization:" key and
+# leaving its value behind (the old two-pass version redacted both).
+_SANITIZE_RE = re.compile(
+    r"(authorization:\s*)\S+(?:\s+\S+)?"
+    r"|(bearer |basic |token=|password=|api_token=|api_key=|secret=|access_token=|private_token=|apikey=|auth_token=)"
+    r"(?!authorization:)\S+",
+    re.IGNORECASE,
+)
+
+
+def _redact(match: re.Match) -> str:
+    return (match.group(1) or match.group(2)) + "***"
+
+
 def _sanitize_error(message: str) -> str:
     """Remove potential credential fragments from error messages.
 
@@ -682,20 +898,7 @@ def _sanitize_error(message: str) -> str:
     denylist check that discards the entire message.
     """
     # Redact values following sensitive keys (e.g., "token=abc123" → "token=***")
-    # First handle "Authorization: <scheme> <token>" as a single unit
-    sanitized = re.sub(
-        r"(authorization:\s*)\S+(?:\s+\S+)?",
-        r"\1***",
-        message,
-        flags=re.IGNORECASE,
-    )
-    sanitized = re.sub(
-        r"(bearer |basic |token=|password=|api_token=|api_key=|secret=|access_token=|private_token=|apikey=|auth_token=)\S+",
-        r"\1***",
-        sanitized,
-        flags=re.IGNORECASE,
-    )
-    return sanitized
+    return _SANITIZE_RE.sub(_redact, message)
 
 
 # === INLINE_END: client ===
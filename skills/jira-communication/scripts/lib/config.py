@@ -4,9 +4,17 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
+# orjson parses profiles.json straight from bytes when a script ships it (see
+# output.py); its JSONDecodeError subclasses the stdlib one, so errors match.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # === INLINE_START: config ===
 
 # Ensure UTF-8 output on Windows — reuse the shared helper so behavior
@@ -17,8 +25,13 @@ if sys.platform == "win32":
     _ensure_utf8_streams()
 
 
+@lru_cache(maxsize=128)
 def normalize_netloc(url: str) -> str:
-    """Normalize a URL's netloc by lowercasing and stripping default ports."""
+    """Normalize a URL's netloc by lowercasing and stripping default ports.
+
+    Memoized: the same few Jira URLs are normalized for every profile lookup
+    and every attachment URL check.
+    """
     parsed = urlparse(url)
     host = parsed.netloc.lower()
     scheme = parsed.scheme.lower()
@@ -32,6 +45,9 @@ def normalize_netloc(url: str) -> str:
 DEFAULT_ENV_FILE = Path.home() / ".env.jira"
 PROFILES_FILE = Path.home() / ".jira" / "profiles.json"
 
+# Accepted JIRA_URL schemes; a tuple so str.startswith() checks all in one call
+URL_SCHEMES = ("http://", "https://")
+
 # Cloud authentication: JIRA_USERNAME + JIRA_API_TOKEN
 # Server/DC authentication: JIRA_PERSONAL_TOKEN (PAT)
 REQUIRED_URL = "JIRA_URL"
@@ -41,6 +57,27 @@ OPTIONAL_VARS = ["JIRA_CLOUD"]
 ALL_VARS = [REQUIRED_URL] + CLOUD_VARS + SERVER_VARS + OPTIONAL_VARS
 
 
+@lru_cache(maxsize=8)
+def _parse_env_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse KEY=value lines of an env file.
+
+    Cached per (path, mtime, size), so repeated loads in one process skip
+    the read while any edit to the file still invalidates the entry.
+    """
+    config = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                key = key.strip()
+                # Strip optional 'export' prefix (bash compatibility)
+                if key.startswith("export "):
+                    key = key[7:].strip()
+                config[key] = value.strip().strip('"').strip("'")
+    return config
+
+
 def load_env(env_file: str | None = None) -> dict:
     """Load configuration from file with environment variable fallback.
 
@@ -64,27 +101,22 @@ def load_env(env_file: str | None = None) -> dict:
     """
     config = {}
     path = Path(env_file) if env_file else DEFAULT_ENV_FILE
+    try:
+        stat = path.stat()
+    except OSError:
+        stat = None
 
     # Load from file if it exists (or raise if explicitly specified but missing)
-    if path.exists():
-        with open(path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, value = line.partition("=")
-                    key = key.strip()
-                    # Strip optional 'export' prefix (bash compatibility)
-                    if key.startswith("export "):
-                        key = key[7:].strip()
-                    config[key] = value.strip().strip('"').strip("'")
+    if stat is not None:
+        # Copy: callers may add keys to the returned dict
+        config = dict(_parse_env_file(str(path), stat.st_mtime_ns, stat.st_size))
     elif env_file:
         # Explicit file was specified but doesn't exist
         raise FileNotFoundError(f"Environment file not found: {path}")
 
-    # Fill in missing values from environment variables
-    for var in ALL_VARS:
-        if var not in config and var in os.environ:
-            config[var] = os.environ[var]
+    # Fill in missing values from environment variables (one os.environ
+    # lookup per variable; `in` + `[]` would encode the key twice)
+    config.update({var: value for var in ALL_VARS if var not in config and (value := os.environ.get(var)) is not None})
 
     return config
 
@@ -111,7 +143,7 @@ def validate_config(config: dict) -> list:
     # Validate URL format
     if REQUIRED_URL in config and config[REQUIRED_URL]:
         url = config[REQUIRED_URL]
-        if not url.startswith(("http://", "https://")):
+        if not url.startswith(URL_SCHEMES):
             errors.append(f"JIRA_URL must start with http:// or https://: {url}")
 
     # Check for valid authentication configuration
@@ -145,6 +177,10 @@ def get_auth_mode(config: dict) -> str:
 def load_profiles() -> dict:
     """Load and validate profiles from ~/.jira/profiles.json.
 
+    The parsed data is cached until the file changes on disk and shared
+    between callers, so treat it as read-only (copy a profile before
+    modifying it, as resolve_profile does).
+
     Returns:
         Parsed profiles dictionary
 
@@ -152,21 +188,65 @@ def load_profiles() -> dict:
         FileNotFoundError: If profiles.json doesn't exist
         ValueError: If profiles.json is invalid
     """
-    if not PROFILES_FILE.exists():
-        raise FileNotFoundError(f"Profiles file not found: {PROFILES_FILE}")
+    return _load_profiles_indexed()[0]
+
 
+def _load_profiles_indexed() -> tuple[dict, dict[str, str], dict[str, list[str]]]:
+    """Return ``(data, host_index, project_index)`` for the current profiles.json."""
     try:
-        data = json.loads(PROFILES_FILE.read_text())
+        stat = PROFILES_FILE.stat()
+    except OSError:
+        raise FileNotFoundError(f"Profiles file not found: {PROFILES_FILE}") from None
+    return _parse_profiles(str(PROFILES_FILE), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _parse_profiles(path: str, mtime_ns: int, size: int) -> tuple[dict, dict[str, str], dict[str, list[str]]]:
+    """Parse and validate profiles.json; cached per (path, mtime, size).
+
+    Alongside the data, builds the lookup indexes resolve_profile uses:
+    normalized host → first profile with that URL, and project key → every
+    profile listing it (more than one means the key is ambiguous).
+    """
+    try:
+        data = _json_loads(Path(path).read_bytes())
     except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in {PROFILES_FILE}: {e}") from e
+        raise ValueError(f"Invalid JSON in {path}: {e}") from e
 
     if not isinstance(data, dict) or "profiles" not in data:
-        raise ValueError(f"Invalid profiles format: missing 'profiles' key in {PROFILES_FILE}")
+        raise ValueError(f"Invalid profiles format: missing 'profiles' key in {path}")
 
     if not isinstance(data["profiles"], dict) or not data["profiles"]:
-        raise ValueError(f"No profiles defined in {PROFILES_FILE}")
+        raise ValueError(f"No profiles defined in {path}")
+
+    host_index: dict[str, str] = {}
+    project_index: dict[str, list[str]] = {}
+    for name, prof in data["profiles"].items():
+        if not isinstance(prof, dict):
+            continue
+        url = prof.get("url", "")
+        host = normalize_netloc(url) if isinstance(url, str) else ""
+        if host:
+            host_index.setdefault(host, name)
+        projects = prof.get("projects")
+        if isinstance(projects, list):
+            for project in dict.fromkeys(p for p in projects if isinstance(p, str)):
+                project_index.setdefault(project, []).append(name)
 
-    return data
+    return data, host_index, project_index
+
+
+# Issue key → project prefix for step 3 of resolve_profile (e.g. WEB-1381 → WEB)
+_ISSUE_KEY_RE = re.compile(r"^([A-Z][A-Z0-9_]+)-\d+$")
+
+
+def _named_profile(profiles: dict, name: str) -> dict:
+    """Return a copy of ``profiles[name]`` with a ``name`` key added.
+
+    A copy rather than a view: the parsed profiles.json is cached, and callers
+    (and json.dumps) expect a plain dict.
+    """
+    return {**profiles[name], "name": name}
 
 
 def resolve_profile(
@@ -194,7 +274,7 @@ def resolve_profile(
         FileNotFoundError: If profiles.json doesn't exist
         ValueError: If profile cannot be resolved or is ambiguous
     """
-    data = load_profiles()
+    data, host_index, project_index = _load_profiles_indexed()
     profiles = data["profiles"]
 
     # Step 1: Explicit profile name
@@ -202,36 +282,23 @@ def resolve_profile(
         if profile not in profiles:
             available = ", ".join(sorted(profiles.keys()))
             raise ValueError(f"Profile '{profile}' not found. Available: {available}")
-        result = dict(profiles[profile])
-        result["name"] = profile
-        return result
+        return _named_profile(profiles, profile)
 
     # Step 2: Full Jira URL → match host (normalized to strip default ports)
     if url:
-        input_host = normalize_netloc(url)
-        if input_host:
-            for name, prof in profiles.items():
-                prof_host = normalize_netloc(prof.get("url", ""))
-                if prof_host and prof_host == input_host:
-                    result = dict(prof)
-                    result["name"] = name
-                    return result
+        name = host_index.get(normalize_netloc(url))
+        if name is not None:
+            return _named_profile(profiles, name)
 
     # Step 3: Ticket key → match project prefix
     if issue_key:
-        match = re.match(r"^([A-Z][A-Z0-9_]+)-\d+$", issue_key)
+        match = _ISSUE_KEY_RE.match(issue_key)
         if match:
             prefix = match.group(1)
-            matching_profiles = []
-            for name, prof in profiles.items():
-                projects = prof.get("projects")
-                if isinstance(projects, list) and prefix in projects:
-                    matching_profiles.append(name)
+            matching_profiles = project_index.get(prefix, [])
 
             if len(matching_profiles) == 1:
-                result = dict(profiles[matching_profiles[0]])
-                result["name"] = matching_profiles[0]
-                return result
+                return _named_profile(profiles, matching_profiles[0])
             elif len(matching_profiles) > 1:
                 names = ", ".join(sorted(matching_profiles))
                 raise ValueError(f"{prefix} found in profiles: {names}. Use --profile to disambiguate.")
@@ -242,9 +309,7 @@ def resolve_profile(
         if profile_file.exists():
             dir_profile = profile_file.read_text().strip()
             if dir_profile in profiles:
-                result = dict(profiles[dir_profile])
-                result["name"] = dir_profile
-                return result
+                return _named_profile(profiles, dir_profile)
             else:
                 print(
                     f"⚠ .jira-profile references unknown profile '{dir_profile}', skipping",
@@ -254,9 +319,7 @@ def resolve_profile(
     # Step 5: Default profile
     default_name = data.get("default")
     if default_name and default_name in profiles:
-        result = dict(profiles[default_name])
-        result["name"] = default_name
-        return result
+        return _named_profile(profiles, default_name)
 
     # No match found
     available = ", ".join(sorted(profiles.keys()))
@@ -276,6 +339,10 @@ def is_cloud_url(url: str) -> bool:
     Returns:
         True if the URL is an Atlassian Cloud instance
     """
+    # The netloc is a substring of the URL, so a URL that doesn't mention the
+    # domain at all (every Server/DC URL) can skip the parse
+    if "atlassian.net" not in url.lower():
+        return False
     netloc = urlparse(url).netloc.lower()
     return netloc == "atlassian.net" or netloc.endswith(".atlassian.net")
 
@@ -2,10 +2,22 @@
 
 import json
 import sys
-from typing import Any
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import Any, TextIO
+
+# orjson is an optional speedup for large --json payloads; scripts that list
+# it in their PEP 723 dependencies get it, everything else uses the stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # === INLINE_START: output ===
 
+# Sentinel for format_table(): distinguishes "no rows" from a falsy first row.
+_NO_ROW = object()
+
 
 def _ensure_utf8_streams() -> None:
     """Reconfigure stdout/stderr to UTF-8 on Windows.
@@ -29,6 +41,15 @@ def _ensure_utf8_streams() -> None:
 _ensure_utf8_streams()
 
 
+# Datetimes and dataclasses go through default=str like they do with json.dumps
+# instead of orjson's native RFC 3339/dict encodings.
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
 def format_json(data: Any, indent: int = 2) -> str:
     """Format data as JSON string.
 
@@ -39,51 +60,80 @@ def format_json(data: Any, indent: int = 2) -> str:
     Returns:
         JSON formatted string
     """
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # orjson.JSONEncodeError, e.g. integers beyond 64 bits
+            pass
     return json.dumps(data, indent=indent, default=str)
 
 
-def format_table(data: list, columns: list | None = None) -> str:
-    """Format list of dicts as ASCII table.
+def format_table(data: Iterable, columns: list | None = None) -> str:
+    """Format dicts as an ASCII table.
+
+    Each cell is stringified once: rows are consumed in a single pass that
+    records cell strings and column widths, so *data* may be a generator.
 
     Args:
-        data: List of dictionaries
+        data: List (or any iterable) of dictionaries
         columns: Optional list of column names to include
 
     Returns:
         ASCII table string
     """
-    if not data:
-        return "(no data)"
+    return "\n".join(_table_lines(data, columns))
+
+
+def stream_table(data: Iterable, columns: list | None = None, out: TextIO | None = None) -> None:
+    """Write the format_table() rendering of *data* to *out* line by line.
+
+    Produces the same text as ``print(format_table(data, columns))`` without
+    first joining every row into one string.
+
+    Args:
+        data: List (or any iterable) of dictionaries
+        columns: Optional list of column names to include
+        out: Stream to write to (default: sys.stdout)
+    """
+    write = (out or sys.stdout).write
+    for line in _table_lines(data, columns):
+        write(line + "\n")
+
+
+def _table_lines(data: Iterable, columns: list | None) -> Iterator[str]:
+    """Yield the header, separator and row lines of an ASCII table."""
+    rows = iter(data)
+    first = next(rows, _NO_ROW)
+    if first is _NO_ROW:
+        yield "(no data)"
+        return
 
     # Determine columns
     if columns is None:
-        columns = list(data[0].keys()) if isinstance(data[0], dict) else ["value"]
+        columns = list(first.keys()) if isinstance(first, dict) else ["value"]
 
-    # Calculate column widths
-    widths = {col: len(col) for col in columns}
-    for row in data:
+    # Stringify cells and track column widths in one pass
+    widths = [len(col) for col in columns]
+    cells: list = []
+    for row in chain((first,), rows):
         if isinstance(row, dict):
-            for col in columns:
-                val = str(row.get(col, ""))
-                widths[col] = max(widths[col], len(val))
-
-    # Build table
-    lines = []
+            values = [str(row.get(col, "")) for col in columns]
+            widths = list(map(max, widths, map(len, values)))
+            cells.append(values)
+        else:
+            cells.append(str(row))
 
     # Header
-    header = " | ".join(col.ljust(widths[col]) for col in columns)
-    lines.append(header)
-    lines.append("-+-".join("-" * widths[col] for col in columns))
+    yield " | ".join(col.ljust(width) for col, width in zip(columns, widths, strict=True))
+    yield "-+-".join("-" * width for width in widths)
 
     # Rows
-    for row in data:
-        if isinstance(row, dict):
-            line = " | ".join(str(row.get(col, "")).ljust(widths[col]) for col in columns)
+    for values in cells:
+        if isinstance(values, str):
+            yield values
         else:
-            line = str(row)
-        lines.append(line)
-
-    return "\n".join(lines)
+            yield " | ".join(value.ljust(width) for value, width in zip(values, widths, strict=True))
 
 
 def compact_json(data: Any) -> Any:
@@ -190,8 +240,9 @@ def warning(message: str) -> None:
 def extract_adf_text(adf) -> str:
     """Extract plain text from Atlassian Document Format.
 
-    Recursively traverses all ADF node types (paragraphs, headings, lists,
-    code blocks, blockquotes, tables, etc.) to extract text content.
+    Traverses all ADF node types (paragraphs, headings, lists, code blocks,
+    blockquotes, tables, etc.) depth-first with an explicit stack, so deeply
+    nested documents cannot hit the recursion limit.
 
     Args:
         adf: ADF dictionary or any other value
@@ -202,21 +253,24 @@ def extract_adf_text(adf) -> str:
     if not isinstance(adf, dict):
         return str(adf)
 
-    parts = _extract_text_recursive(adf)
-    return " ".join(parts)
-
-
-def _extract_text_recursive(node) -> list:
-    """Recursively extract text from any ADF node."""
-    parts = []
-    if isinstance(node, dict):
+    parts: list[str] = []
+    append = parts.append
+    stack = [adf]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        if not isinstance(node, dict):
+            continue
         if node.get("type") == "text":
             text = node.get("text", "")
             if text:
-                parts.append(text)
-        for child in node.get("content", []):
-            parts.extend(_extract_text_recursive(child))
-    return parts
+                append(text)
+        content = node.get("content")
+        if content:
+            # Reversed so children pop off the stack in document order
+            extend(reversed(content))
+    return " ".join(parts)
 
 
 def comment_to_text(comment) -> str:
@@ -16,17 +16,14 @@ without making 5+ separate API calls.
 Designed for the peer-qa-review skill but useful for any review workflow.
 """
 
+import os
 import re
 import sys
-from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Shared library import (TR1.1.1 - PYTHONPATH approach)
 # ═══════════════════════════════════════════════════════════════════════════════
-_script_dir = Path(__file__).parent
-_lib_path = _script_dir.parent / "lib"
-if _lib_path.exists():
-    sys.path.insert(0, str(_lib_path.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import click
 from lib.client import LazyJiraClient, _sanitize_error
@@ -8,16 +8,13 @@
 # ///
 """Jira sprint operations - list sprints and get sprint issues."""
 
+import os
 import sys
-from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Shared library import (TR1.1.1 - PYTHONPATH approach)
 # ═══════════════════════════════════════════════════════════════════════════════
-_script_dir = Path(__file__).parent
-_lib_path = _script_dir.parent / "lib"
-if _lib_path.exists():
-    sys.path.insert(0, str(_lib_path.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import click
 from lib.client import LazyJiraClient
@@ -146,8 +143,7 @@ def issues(ctx, sprint_id: int, fields: str):
         if ctx.obj["json"]:
             format_output(issues_list, as_json=True)
         elif ctx.obj["quiet"]:
-            for issue in issues_list:
-                print(issue["key"])
+            sys.stdout.write("".join(f"{issue['key']}\n" for issue in issues_list))
         else:
             if not issues_list:
                 print(f"No issues in sprint {sprint_id}")
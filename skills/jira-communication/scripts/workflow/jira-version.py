@@ -8,17 +8,14 @@
 # ///
 """Jira project version operations - list, get, create, update, release lifecycle, move, merge, delete."""
 
+import os
 import sys
 from datetime import date as _date
-from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Shared library import (TR1.1.1 - PYTHONPATH approach)
 # ═══════════════════════════════════════════════════════════════════════════════
-_script_dir = Path(__file__).parent
-_lib_path = _script_dir.parent / "lib"
-if _lib_path.exists():
-    sys.path.insert(0, str(_lib_path.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import click
 from lib.client import AuthenticationError, LazyJiraClient, SessionExpiredError
@@ -1,12 +1,15 @@
 """Tests for jira-attachment.py security controls (SSRF, Path Traversal, TLS)."""
 
 import importlib.util
+import io
 import sys
 from pathlib import Path
 from unittest import mock
 
 import click.testing
 import pytest
+import requests
+from urllib3.exceptions import ProtocolError
 
 # Add scripts to path for lib imports
 _test_dir = Path(__file__).parent
@@ -213,7 +216,7 @@ def _make_mock_response(
         headers["Content-Disposition"] = content_disposition
     resp.headers = headers
     resp.raise_for_status = mock.Mock()
-    resp.iter_content = mock.Mock(return_value=iter([body]))
+    resp.raw = io.BytesIO(body)
     return resp
 
 
@@ -298,7 +301,7 @@ class TestDownloadContentTypeGuard:
         with (
             mock.patch.object(jira_attachment, "load_config", return_value=_FAKE_CONFIG),
             mock.patch.object(
-                jira_attachment.requests,
+                jira_attachment._http_session(),
                 "get",
                 return_value=_make_mock_response(content_type, b"fake", content_disposition=content_disposition),
             ),
@@ -341,6 +344,62 @@ class TestDownloadContentTypeGuard:
         assert out.read_bytes() == b"fake"
 
 
+class TestDownloadPreallocation:
+    """Large downloads are preallocated; the file still ends at the body length."""
+
+    def test_short_body_truncates_preallocated_tail(self, tmp_path):
+        resp = _make_mock_response("application/octet-stream", b"data")
+        resp.headers["Content-Length"] = "4096"
+        out = tmp_path / "out.bin"
+        with (
+            mock.patch.object(jira_attachment, "PREALLOCATE_THRESHOLD", 1024),
+            mock.patch.object(jira_attachment._http_session(), "get", return_value=resp),
+        ):
+            jira_attachment._stream_to_path(resp.url, _JIRA_URL, None, {}, out)
+        assert out.read_bytes() == b"data"
+
+    def test_compressed_body_is_not_preallocated(self, tmp_path):
+        resp = _make_mock_response("application/octet-stream", b"data")
+        resp.headers.update({"Content-Length": "4096", "Content-Encoding": "gzip"})
+        with (
+            mock.patch.object(jira_attachment, "PREALLOCATE_THRESHOLD", 1024),
+            mock.patch.object(jira_attachment.os, "posix_fallocate", create=True) as fallocate,
+        ):
+            jira_attachment._preallocate(0, resp)
+        fallocate.assert_not_called()
+
+
+class _FailingStream(io.RawIOBase):
+    """Raw body that fails on the first read, like a dropped connection."""
+
+    def readinto(self, buffer):
+        raise ProtocolError("Connection broken: IncompleteRead")
+
+
+class TestDownloadStreamErrors:
+    """urllib3 errors from the raw stream surface as requests exceptions."""
+
+    def test_broken_stream_raises_requests_exception(self, tmp_path):
+        resp = _make_mock_response("application/octet-stream")
+        resp.raw = _FailingStream()
+        with mock.patch.object(jira_attachment._http_session(), "get", return_value=resp):
+            with pytest.raises(requests.exceptions.RequestException):
+                jira_attachment._stream_to_path(resp.url, _JIRA_URL, None, {}, tmp_path / "out.bin")
+
+    def test_broken_stream_removes_preallocated_file(self, tmp_path):
+        resp = _make_mock_response("application/octet-stream")
+        resp.headers["Content-Length"] = "4096"
+        resp.raw = _FailingStream()
+        out = tmp_path / "out.bin"
+        with (
+            mock.patch.object(jira_attachment, "PREALLOCATE_THRESHOLD", 1024),
+            mock.patch.object(jira_attachment._http_session(), "get", return_value=resp),
+        ):
+            with pytest.raises(requests.exceptions.RequestException):
+                jira_attachment._stream_to_path(resp.url, _JIRA_URL, None, {}, out)
+        assert not out.exists()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: _build_auth helper
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -400,7 +459,7 @@ class TestDownloadAll:
 
         with (
             mock.patch.object(jira_attachment, "load_config", return_value=_FAKE_CONFIG),
-            mock.patch.object(jira_attachment.requests, "get", side_effect=fake_get),
+            mock.patch.object(jira_attachment._http_session(), "get", side_effect=fake_get),
             mock.patch.object(jira_attachment.Path, "cwd", return_value=tmp_path),
         ):
             result = runner.invoke(jira_attachment.cli, ["download-all", "TEST-1", *(extra_args or [])])
@@ -452,7 +511,7 @@ class TestDownloadAll:
 
         with (
             mock.patch.object(jira_attachment, "load_config", return_value=_FAKE_CONFIG),
-            mock.patch.object(jira_attachment.requests, "get", side_effect=fake_get),
+            mock.patch.object(jira_attachment._http_session(), "get", side_effect=fake_get),
             mock.patch.object(jira_attachment.Path, "cwd", return_value=tmp_path),
         ):
             result = runner.invoke(jira_attachment.cli, ["--json", "download-all", "TEST-1", "--dry-run"])
@@ -476,7 +535,7 @@ class TestDownloadAll:
 
         with (
             mock.patch.object(jira_attachment, "load_config", return_value=_FAKE_CONFIG),
-            mock.patch.object(jira_attachment.requests, "get", side_effect=fake_get),
+            mock.patch.object(jira_attachment._http_session(), "get", side_effect=fake_get),
             mock.patch.object(jira_attachment.Path, "cwd", return_value=tmp_path),
         ):
             result = runner.invoke(jira_attachment.cli, ["download-all", "TEST-1"])
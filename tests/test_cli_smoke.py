@@ -4,9 +4,11 @@ These tests use click.testing.CliRunner with mocked Jira clients to verify
 that CLI scripts load correctly, parse options, and handle errors gracefully.
 """
 
+import json
 from unittest import mock
 
 import click.testing
+import requests
 from conftest import load_script
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -151,6 +153,9 @@ class TestSubcommandHelp:
     def test_worklog_add_help(self):
         self._run_help(_worklog_mod.cli, ["add", "--help"])
 
+    def test_worklog_add_batch_help(self):
+        self._run_help(_worklog_mod.cli, ["add-batch", "--help"])
+
     def test_worklog_list_help(self):
         self._run_help(_worklog_mod.cli, ["list", "--help"])
 
@@ -259,6 +264,19 @@ class TestMockedCommands:
         assert result.exit_code == 0, result.output
         assert "TEST-1" in result.output
 
+    def test_get_and_query_skip_field_metadata(self):
+        """get/query must not fetch /rest/api/2/field metadata they never use."""
+        mock_client = self._make_mock_client()
+        mock_client.issue.return_value = {"key": "TEST-1", "fields": {"summary": "Test"}}
+        mock_client.get_issue_remote_links.return_value = []
+        mock_client.jql.return_value = {"issues": [{"key": "TEST-1"}], "total": 1}
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            assert runner.invoke(_issue_mod.cli, ["get", "TEST-1"]).exit_code == 0
+            assert runner.invoke(_search_mod.cli, ["query", "project=TEST"]).exit_code == 0
+        mock_client.get_all_fields.assert_not_called()
+        mock_client.get.assert_not_called()
+
     def test_search_query_quiet(self):
         """jira-search --quiet query JQL must output issue keys only."""
         mock_client = self._make_mock_client()
@@ -272,6 +290,28 @@ class TestMockedCommands:
         assert "A-1" in result.output
         assert "A-2" in result.output
 
+    def test_search_query_quiet_requests_key_field_only(self):
+        """--quiet renders keys only, so only the key field is requested."""
+        mock_client = self._make_mock_client()
+        mock_client.jql.return_value = {"issues": [{"key": "A-1"}], "total": 1}
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_search_mod.cli, ["--quiet", "query", "project=A", "-f", "key,summary,status"])
+        assert result.exit_code == 0, result.output
+        assert mock_client.jql.call_args.kwargs["fields"] == ("key",)
+
+    def test_search_json_quiet_keeps_requested_fields(self):
+        """--json wins over --quiet in the output, so the requested fields are still fetched."""
+        mock_client = self._make_mock_client()
+        mock_client.jql.return_value = {"issues": [{"key": "A-1", "fields": {"summary": "S"}}], "total": 1}
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_search_mod.cli, ["--json", "--quiet", "query", "project=A", "-f", "summary"])
+        assert result.exit_code == 0, result.output
+        assert mock_client.jql.call_args.kwargs["fields"] != ("key",)
+        assert "summary" in mock_client.jql.call_args.kwargs["fields"]
+        assert '"summary": "S"' in result.output
+
     def test_search_query_start_at_forwarded(self):
         """jira-search --start-at must be forwarded to client.jql(start=...)."""
         mock_client = self._make_mock_client()
@@ -362,6 +402,140 @@ class TestMockedCommands:
         assert result.exit_code == 0, result.output
         assert "Server capped results" not in result.output
 
+    def test_search_query_large_window_fetches_pages_in_order(self):
+        """--max-results above one page must be split into ordered page requests."""
+        mock_client = self._make_mock_client()
+
+        def fake_jql(jql, limit, start, fields):
+            stop = min(start + limit, 230)
+            return {"issues": [{"key": f"A-{i}"} for i in range(start, stop)], "total": 230}
+
+        mock_client.jql.side_effect = fake_jql
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_search_mod.cli, ["--quiet", "query", "project=A", "--max-results", "250"])
+        assert result.exit_code == 0, result.output
+        assert result.output.split() == [f"A-{i}" for i in range(230)]
+        starts = sorted(c.kwargs["start"] for c in mock_client.jql.call_args_list)
+        assert starts == [0, 100, 200]
+
+    def test_search_query_large_window_adapts_to_server_page_cap(self):
+        """A server capping maxResults below --page-size must not truncate the window."""
+        mock_client = self._make_mock_client()
+
+        def fake_jql(jql, limit, start, fields):
+            stop = min(start + min(limit, 50), 120)
+            return {"issues": [{"key": f"A-{i}"} for i in range(start, stop)], "total": 120}
+
+        mock_client.jql.side_effect = fake_jql
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(
+                _search_mod.cli, ["--quiet", "query", "project=A", "--max-results", "500", "--page-size", "200"]
+            )
+        assert result.exit_code == 0, result.output
+        assert "Server caps page size at 50" in result.output
+        assert [line for line in result.output.split() if line.startswith("A-")] == [f"A-{i}" for i in range(120)]
+
+    def test_search_query_quiet_streams_keys_before_later_pages(self):
+        """--quiet writes each page's keys as it arrives, not after the whole window."""
+        mock_client = self._make_mock_client()
+
+        def fake_jql(jql, limit, start, fields):
+            if start:
+                raise RuntimeError("boom")
+            return {"issues": [{"key": f"A-{i}"} for i in range(limit)], "total": 300}
+
+        mock_client.jql.side_effect = fake_jql
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_search_mod.cli, ["--quiet", "query", "project=A", "--max-results", "300"])
+        assert result.exit_code == 1
+        assert result.output.startswith("A-0\nA-1\n")
+        assert "Search failed: boom" in result.output
+
+    def test_search_query_large_window_json_merges_pages(self):
+        """Non-quiet output still sees the whole window as one ordered issue list."""
+        mock_client = self._make_mock_client()
+
+        def fake_jql(jql, limit, start, fields):
+            stop = min(start + limit, 150)
+            return {"issues": [{"key": f"A-{i}"} for i in range(start, stop)], "total": 150}
+
+        mock_client.jql.side_effect = fake_jql
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_search_mod.cli, ["--json", "query", "project=A", "--max-results", "150"])
+        assert result.exit_code == 0, result.output
+        assert [issue["key"] for issue in json.loads(result.output)] == [f"A-{i}" for i in range(150)]
+
+    def test_search_query_large_window_single_call_on_cloud(self):
+        """Cloud search is cursor-based, so the window must not be split by offset."""
+        mock_client = self._make_mock_client()
+        mock_client.url = "https://example.atlassian.net"
+        mock_client.get.return_value = {"issues": [{"key": "A-1"}], "isLast": True}
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_search_mod.cli, ["--quiet", "query", "project=A", "--max-results", "250"])
+        assert result.exit_code == 0, result.output
+        mock_client.get.assert_called_once()
+
+    def test_search_query_default_fields(self):
+        """Without --fields, the default column tuple is requested as is."""
+        mock_client = self._make_mock_client()
+        mock_client.jql.return_value = {"issues": [], "total": 0}
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_search_mod.cli, ["query", "project=A"])
+        assert result.exit_code == 0, result.output
+        assert mock_client.jql.call_args.kwargs["fields"] is _search_mod.DEFAULT_FIELDS
+        assert _search_mod.DEFAULT_FIELDS == ("key", "summary", "status", "assignee", "priority")
+
+    def test_search_parse_fields_returns_cached_tuple(self):
+        """--fields parses to a tuple, and repeated values reuse the parsed result."""
+        parsed = _search_mod._parse_fields(" key , summary,status ")
+        assert parsed == ("key", "summary", "status")
+        assert _search_mod._parse_fields(" key , summary,status ") is parsed
+
+    def test_search_result_rows_cell_formatting(self):
+        """Table cells: nested name/displayName/value, capped lists, '-' for null."""
+        issue = {
+            "key": "A-1",
+            "fields": {
+                "status": {"name": "Open"},
+                "assignee": {"displayName": "Jane"},
+                "customfield_1": {"value": "Gold"},
+                "customfield_2": {"value": 7},
+                "labels": ["a", "b", "c", "d"],
+                "priority": None,
+                "votes": 3,
+                "summary": "x" * 30,
+            },
+        }
+        fields = [
+            "key",
+            "status",
+            "assignee",
+            "customfield_1",
+            "customfield_2",
+            "labels",
+            "priority",
+            "votes",
+            "summary",
+        ]
+        (row,) = _search_mod._result_rows([issue], tuple(fields[1:]), truncate=10)
+        assert row == {
+            "key": "A-1",
+            "status": "Open",
+            "assignee": "Jane",
+            "customfield_1": "Gold",
+            "customfield_2": "7",
+            "labels": "a, b, c...",
+            "priority": "-",
+            "votes": "3",
+            "summary": "xxxxxxx...",
+        }
+
     def test_search_query_order_by_appends_to_jql(self):
         """--order-by must append a single ORDER BY clause to the JQL string."""
         mock_client = self._make_mock_client()
@@ -669,6 +843,21 @@ class TestMockedCommands:
         params = kwargs.get("params", {})
         assert params.get("name") == "Lithium"
 
+    def test_board_and_sprint_issues_quiet_print_keys(self):
+        """--quiet agile issue listings print one key per line and nothing for no issues."""
+        mock_client = self._make_mock_client()
+        mock_client.get.return_value = {"issues": [{"key": "A-1"}, {"key": "A-2"}]}
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            board = runner.invoke(_board_mod.cli, ["--quiet", "issues", "42"])
+            sprint = runner.invoke(_sprint_mod.cli, ["--quiet", "issues", "7"])
+            mock_client.get.return_value = {"issues": []}
+            empty = runner.invoke(_board_mod.cli, ["--quiet", "issues", "42"])
+        assert board.exit_code == 0, board.output
+        assert board.output == "A-1\nA-2\n"
+        assert sprint.output == "A-1\nA-2\n"
+        assert empty.output == ""
+
     def test_board_list_paginates_until_last_page(self):
         """jira-board list must follow agile pagination when isLast is false."""
         mock_client = self._make_mock_client()
@@ -718,6 +907,18 @@ class TestMockedCommands:
         payload = args[1]
         assert payload["labels"] == ["bar", "Baz", "Foo"]
 
+    def test_issue_cache_ttl_applies_to_get_only(self):
+        """update reads labels before writing them back, so it must never see cached GETs."""
+        mock_client = self._make_mock_client()
+        mock_client.issue.return_value = {"key": "TEST-1", "fields": {"labels": []}}
+        mock_client.get_issue_remote_links.return_value = []
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client) as mock_get:
+            runner.invoke(_issue_mod.cli, ["--cache-ttl", "60", "get", "TEST-1"])
+            assert mock_get.call_args.kwargs["cache_ttl"] == 60
+            runner.invoke(_issue_mod.cli, ["--cache-ttl", "60", "update", "TEST-1", "--add-label", "x"])
+            assert "cache_ttl" not in mock_get.call_args.kwargs
+
     def test_issue_update_remove_labels_matches_case_insensitively(self):
         mock_client = self._make_mock_client()
         mock_client.issue.return_value = {"fields": {"labels": ["Foo", "BAR"]}}
@@ -729,6 +930,15 @@ class TestMockedCommands:
         args, _kwargs = mock_client.update_issue_field.call_args
         assert args[1]["labels"] == []
 
+    def test_issue_update_labels_replace_strips_whitespace_around_commas(self):
+        mock_client = self._make_mock_client()
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_issue_mod.cli, ["update", "TEST-1", "--labels", " a , b,c "])
+        assert result.exit_code == 0, result.output
+        args, _kwargs = mock_client.update_issue_field.call_args
+        assert args[1]["labels"] == ["a", "b", "c"]
+
     def test_issue_update_rejects_labels_with_incremental_flags(self):
         mock_client = self._make_mock_client()
         runner = click.testing.CliRunner()
@@ -836,6 +1046,55 @@ class TestMockedCommands:
         assert "assignee" not in result.output
         assert "TEST-1" in result.output
 
+    def test_issue_get_multiple_keys_uses_one_jql_search(self):
+        """jira-issue get with several keys must batch them into one JQL search."""
+        mock_client = self._make_mock_client()
+        mock_client.jql.return_value = {
+            "issues": [
+                {"key": "TEST-2", "fields": {"summary": "Second"}},
+                {"key": "TEST-1", "fields": {"summary": "First"}},
+            ],
+        }
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_issue_mod.cli, ["--quiet", "get", "TEST-1", "TEST-2"])
+        assert result.exit_code == 0, result.output
+        assert result.output.split() == ["TEST-1", "TEST-2"]
+        mock_client.issue.assert_not_called()
+        mock_client.get_issue_remote_links.assert_not_called()
+        mock_client.jql.assert_called_once()
+        assert mock_client.jql.call_args.args[0] == 'key in ("TEST-1", "TEST-2")'
+
+    def test_issue_get_multiple_keys_warns_on_missing(self):
+        """Keys Jira does not return must be reported, not silently dropped."""
+        mock_client = self._make_mock_client()
+        mock_client.jql.return_value = {"issues": [{"key": "TEST-1", "fields": {"summary": "First"}}]}
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_issue_mod.cli, ["--json", "get", "TEST-1", "TEST-9"])
+        assert result.exit_code == 0, result.output
+        assert "TEST-9" in result.output
+
+    def test_issue_get_multiple_keys_survives_rejected_batch(self):
+        """A batch rejected over one unknown key falls back to per-key fetches."""
+        mock_client = self._make_mock_client()
+        mock_client.jql.side_effect = requests.exceptions.HTTPError("400: An issue with key 'BAD-1' does not exist")
+
+        def fake_issue(key, **_params):
+            if key == "BAD-1":
+                raise requests.exceptions.HTTPError("404: Issue does not exist")
+            return {"key": key, "fields": {"summary": f"Summary {key}"}}
+
+        mock_client.issue.side_effect = fake_issue
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_issue_mod.cli, ["--json", "get", "TEST-1", "BAD-1", "TEST-2"])
+        assert result.exit_code == 0, result.output
+        assert mock_client.jql.call_args.kwargs["validate_query"] == "warn"
+        assert "Summary TEST-1" in result.output
+        assert "Summary TEST-2" in result.output
+        assert "Not returned by Jira: BAD-1" in result.output
+
     def test_issue_get_json_raw_preserves_nulls(self):
         """jira-issue --json get --raw must keep null/empty fields."""
         mock_client = self._make_mock_client()
@@ -956,7 +1215,7 @@ class TestMockedCommands:
             "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Implemented retry logic"}]}],
         }
         mock_client = self._make_mock_client()
-        mock_client.issue_get_worklog.return_value = {
+        mock_client.get.return_value = {
             "worklogs": [
                 {
                     "id": "1",
@@ -987,7 +1246,7 @@ class TestMockedCommands:
             ],
         }
         mock_client = self._make_mock_client()
-        mock_client.issue_get_worklog.return_value = {
+        mock_client.get.return_value = {
             "worklogs": [
                 {
                     "id": "1",
@@ -1005,6 +1264,86 @@ class TestMockedCommands:
         assert result.exit_code == 0, result.output
         assert "..." in result.output
 
+    def test_worklog_list_fetches_only_the_newest_page(self):
+        """jira-worklog list must request the tail page, not the whole history."""
+        mock_client = self._make_mock_client()
+        first = {"startAt": 0, "maxResults": 2, "total": 5, "worklogs": [{"id": "1"}, {"id": "2"}]}
+        tail = {"startAt": 3, "maxResults": 2, "total": 5, "worklogs": [{"id": "4"}, {"id": "5"}]}
+        mock_client.get.side_effect = [first, tail]
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_worklog_mod.cli, ["--quiet", "list", "TEST-1", "--limit", "2"])
+        assert result.exit_code == 0, result.output
+        assert result.output.split() == ["5", "4"]
+        assert mock_client.get.call_args_list[-1] == mock.call(
+            "rest/api/2/issue/TEST-1/worklog", params={"startAt": 3, "maxResults": 2}
+        )
+        mock_client.issue_get_worklog.assert_not_called()
+
+    def test_worklog_list_pages_through_capped_server_pages(self):
+        """A server capping maxResults below --limit still yields the newest --limit entries."""
+        mock_client = self._make_mock_client()
+        history = [{"id": str(i)} for i in range(1, 8)]
+
+        def capped_get(path, params):
+            start = params["startAt"]
+            assert start >= 0
+            return {
+                "startAt": start,
+                "total": len(history),
+                "worklogs": history[start : start + min(2, params["maxResults"])],
+            }
+
+        mock_client.get.side_effect = capped_get
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_worklog_mod.cli, ["--quiet", "list", "TEST-1", "--limit", "5"])
+            assert result.exit_code == 0, result.output
+            assert result.output.split() == ["7", "6", "5", "4", "3"]
+            result = runner.invoke(_worklog_mod.cli, ["--quiet", "list", "TEST-1", "--limit", "100"])
+        assert result.exit_code == 0, result.output
+        assert result.output.split() == ["7", "6", "5", "4", "3", "2", "1"]
+
+    def test_worklog_add_batch_books_all_entries_on_one_client(self):
+        """add-batch must post every CSV row through a single client."""
+        mock_client = self._make_mock_client()
+        mock_client.issue_add_json_worklog.side_effect = [{"id": "11"}, {"id": "12"}]
+        entries = "# key,time,started,comment\nTEST-1,2h,2025-01-15T09:00+01:00,Review\n\nTEST-2,30m\n"
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client) as mock_get:
+            result = runner.invoke(_worklog_mod.cli, ["--quiet", "add-batch", "-"], input=entries)
+        assert result.exit_code == 0, result.output
+        assert result.output.split() == ["11", "12"]
+        mock_get.assert_called_once()
+        first, second = mock_client.issue_add_json_worklog.call_args_list
+        assert first.args == (
+            "TEST-1",
+            {"timeSpent": "2h", "comment": "Review", "started": "2025-01-15T09:00:00.000+0100"},
+        )
+        assert second.args[0] == "TEST-2"
+        assert second.args[1]["timeSpent"] == "30m"
+
+    def test_worklog_add_batch_rejects_malformed_line_before_booking(self):
+        """A bad line must abort the batch before any worklog is added."""
+        mock_client = self._make_mock_client()
+        runner = click.testing.CliRunner()
+        with mock.patch("lib.client.get_jira_client", return_value=mock_client):
+            result = runner.invoke(_worklog_mod.cli, ["add-batch", "-"], input="TEST-1,2h\nTEST-2\n")
+        assert result.exit_code == 1
+        assert "Line 2" in result.output
+        mock_client.issue_add_json_worklog.assert_not_called()
+
+    def test_worklog_timestamp_normalization(self):
+        """normalize_iso_timestamp fills in seconds, millis and the timezone."""
+        normalize = _worklog_mod.normalize_iso_timestamp
+        with mock.patch.object(_worklog_mod, "_local_tz_offset", return_value="+0200") as local_tz:
+            assert normalize("2025-01-15T09:00:00.000+0100") == "2025-01-15T09:00:00.000+0100"
+            assert normalize("2025-01-15T09:00+01:00") == "2025-01-15T09:00:00.000+0100"
+            # Explicit offsets never need the local timezone lookup
+            local_tz.assert_not_called()
+            assert normalize("2025-01-15") == "2025-01-15T00:00:00.000+0200"
+            assert normalize("2025-01-15T09:00") == "2025-01-15T09:00:00.000+0200"
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: jira-issue intent verbs (work / qa / qa-fail / act)
@@ -4,15 +4,21 @@ import sys
 from pathlib import Path
 from unittest import mock
 
+import pytest
+
 # Add scripts to path for lib imports
 _test_dir = Path(__file__).parent
 _scripts_path = _test_dir.parent / "skills" / "jira-communication" / "scripts"
 sys.path.insert(0, str(_scripts_path))
 
 from lib.client import (
+    HTTP_POOL_SIZE,
     JIRA_TIMEOUT,
+    CaptchaError,
     LazyJiraClient,
     _check_captcha_challenge,
+    _patch_session_for_rate_limit_pacing,
+    _RateLimitPacer,
     _sanitize_error,
     get_jira_client,
     get_project_issue_types,
@@ -130,6 +136,19 @@ class TestLazyJiraClient:
             lazy.project("PROJ")
             mock_get.assert_called_once()
 
+    def test_preloaded_config_skips_config_loading(self):
+        """A config passed to the constructor is used as-is instead of being re-read."""
+        config = {"JIRA_URL": "https://jira.example.com", "JIRA_PERSONAL_TOKEN": "t"}
+        mock_client = mock.Mock()
+        with (
+            mock.patch("lib.client.get_jira_client") as mock_get,
+            mock.patch("lib.client.get_jira_client_from_config", return_value=mock_client) as mock_from_config,
+        ):
+            lazy = LazyJiraClient(config=config)
+            lazy.myself()
+            mock_get.assert_not_called()
+            mock_from_config.assert_called_once_with(config)
+
     def test_with_context_ignored_after_init(self):
         """with_context() has no effect after the client is already created."""
         mock_client = mock.Mock()
@@ -159,6 +178,15 @@ class TestLazyJiraClient:
             assert result == {"displayName": "Test User"}
             mock_client.myself.assert_called_once()
 
+    def test_slot_state_is_not_forwarded(self):
+        """Internal state lives in slots; reading it never builds the real client."""
+        with mock.patch("lib.client.get_jira_client") as mock_get:
+            lazy = LazyJiraClient(profile="default")
+            assert lazy._client is None
+            with pytest.raises(AttributeError):
+                lazy.unexpected = 1
+            mock_get.assert_not_called()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: LazyJiraClient.jql() override for Cloud (CHANGE-2046)
@@ -434,6 +462,156 @@ class TestJiraClientRetry:
             assert "https://" in mount_calls
             assert "http://" in mount_calls
 
+    def test_retry_honours_retry_after(self):
+        """The retry strategy must back off per Retry-After on 429."""
+        config = {
+            "JIRA_URL": "https://jira.example.com",
+            "JIRA_PERSONAL_TOKEN": "test-token",
+        }
+        with mock.patch("lib.client.load_config", return_value=config), mock.patch("lib.client.Jira") as MockJira:
+            mock_session = mock.Mock()
+            MockJira.return_value._session = mock_session
+            get_jira_client()
+        adapter = mock_session.mount.call_args_list[0][0][1]
+        assert 429 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.respect_retry_after_header is True
+
+    def test_pool_sized_for_concurrent_pages(self):
+        """The adapter keeps HTTP_POOL_SIZE keep-alive connections per host."""
+        config = {
+            "JIRA_URL": "https://jira.example.com",
+            "JIRA_PERSONAL_TOKEN": "test-token",
+        }
+        with mock.patch("lib.client.load_config", return_value=config), mock.patch("lib.client.Jira") as MockJira:
+            mock_session = mock.Mock()
+            MockJira.return_value._session = mock_session
+            get_jira_client()
+        adapter = mock_session.mount.call_args_list[0][0][1]
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
+
+
+class TestRateLimitPacer:
+    """_RateLimitPacer must delay the next request only when the bucket is empty."""
+
+    _EMPTY = {"X-RateLimit-Remaining": "0", "X-RateLimit-FillRate": "10", "X-RateLimit-Interval-Seconds": "1"}
+
+    def test_empty_bucket_delays_next_request(self):
+        pacer = _RateLimitPacer()
+        with mock.patch("lib.client.time.monotonic", return_value=100.0):
+            pacer.update(self._EMPTY)
+        with mock.patch("lib.client.time.monotonic", return_value=100.0), mock.patch("lib.client.time.sleep") as sleep:
+            pacer.wait()
+        sleep.assert_called_once()
+        assert sleep.call_args.args[0] == pytest.approx(0.1)
+
+    def test_remaining_tokens_do_not_delay(self):
+        pacer = _RateLimitPacer()
+        pacer.update({**self._EMPTY, "X-RateLimit-Remaining": "5"})
+        with mock.patch("lib.client.time.sleep") as sleep:
+            pacer.wait()
+        sleep.assert_not_called()
+
+    def test_missing_headers_ignored(self):
+        pacer = _RateLimitPacer()
+        pacer.update({})
+        with mock.patch("lib.client.time.sleep") as sleep:
+            pacer.wait()
+        sleep.assert_not_called()
+
+    def test_cached_responses_do_not_update_pacer(self):
+        """A requests-cache hit carries stale rate-limit headers and must not cause a sleep."""
+        client = mock.Mock()
+        client._session.request.return_value = mock.Mock(headers=self._EMPTY, from_cache=True)
+        _patch_session_for_rate_limit_pacing(client)
+        with mock.patch("lib.client.time.sleep") as sleep:
+            client._session.request("GET", "https://jira.example.com/rest/api/2/myself")
+            client._session.request("GET", "https://jira.example.com/rest/api/2/myself")
+        sleep.assert_not_called()
+
+    def test_live_empty_bucket_paces_next_request(self):
+        client = mock.Mock()
+        client._session.request.return_value = mock.Mock(headers=self._EMPTY, from_cache=False)
+        _patch_session_for_rate_limit_pacing(client)
+        with mock.patch("lib.client.time.sleep") as sleep:
+            client._session.request("GET", "https://jira.example.com/rest/api/2/myself")
+            client._session.request("GET", "https://jira.example.com/rest/api/2/myself")
+        sleep.assert_called_once()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tests: opt-in response cache (--cache-ttl)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestJiraClientResponseCache:
+    """cache_ttl swaps in a requests-cache session only when the package exists."""
+
+    _CONFIG = {"JIRA_URL": "https://jira.example.com", "JIRA_PERSONAL_TOKEN": "test-token"}
+
+    def test_cache_disabled_by_default(self):
+        with mock.patch("lib.client.load_config", return_value=self._CONFIG), mock.patch("lib.client.Jira") as MockJira:
+            session = mock.Mock()
+            MockJira.return_value._session = session
+            client = get_jira_client()
+        assert client._session is session
+
+    def test_missing_requests_cache_warns_and_keeps_session(self, capsys):
+        with (
+            mock.patch("lib.client.load_config", return_value=self._CONFIG),
+            mock.patch("lib.client.Jira") as MockJira,
+            mock.patch.dict(sys.modules, {"requests_cache": None}),
+        ):
+            session = mock.Mock()
+            MockJira.return_value._session = session
+            client = get_jira_client(cache_ttl=60)
+        assert client._session is session
+        assert "requests-cache is not installed" in capsys.readouterr().err
+
+    def test_cached_session_inherits_auth_and_caches_get_only(self, tmp_path):
+        fake_module = mock.Mock()
+        with (
+            mock.patch("lib.client.load_config", return_value=self._CONFIG),
+            mock.patch("lib.client.Jira") as MockJira,
+            mock.patch("lib.client.HTTP_CACHE_DIR", tmp_path / "cache"),
+            mock.patch.dict(sys.modules, {"requests_cache": fake_module}),
+        ):
+            old_session = mock.Mock()
+            MockJira.return_value._session = old_session
+            client = get_jira_client(cache_ttl=60)
+        _, kwargs = fake_module.CachedSession.call_args
+        assert kwargs["expire_after"] == 60
+        assert kwargs["allowable_methods"] == ("GET",)
+        assert kwargs["cache_name"].startswith(str(tmp_path / "cache" / "http_cache-"))
+        assert client._session is fake_module.CachedSession.return_value
+        assert client._session.auth is old_session.auth
+
+    def test_cache_database_differs_per_token(self, tmp_path):
+        """requests-cache redacts Authorization from its keys, so tokens get separate databases."""
+        names = []
+        for token in ("token-a", "token-b", "token-a"):
+            fake_module = mock.Mock()
+            with (
+                mock.patch("lib.client.load_config", return_value={**self._CONFIG, "JIRA_PERSONAL_TOKEN": token}),
+                mock.patch("lib.client.Jira"),
+                mock.patch("lib.client.HTTP_CACHE_DIR", tmp_path / "cache"),
+                mock.patch.dict(sys.modules, {"requests_cache": fake_module}),
+            ):
+                get_jira_client(cache_ttl=60)
+            names.append(fake_module.CachedSession.call_args.kwargs["cache_name"])
+        assert names[0] != names[1]
+        assert names[0] == names[2]
+        assert "token-a" not in names[0]
+
+    def test_lazy_client_forwards_cache_ttl(self):
+        with mock.patch("lib.client.get_jira_client") as mock_get:
+            LazyJiraClient(cache_ttl=30).myself()
+        assert mock_get.call_args.kwargs["cache_ttl"] == 30
+
+    def test_lazy_client_without_cache_drops_cache_ttl(self):
+        with mock.patch("lib.client.get_jira_client") as mock_get:
+            LazyJiraClient(cache_ttl=30).without_cache().myself()
+        assert "cache_ttl" not in mock_get.call_args.kwargs
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: CAPTCHA login_url validation (F5)
@@ -467,6 +645,21 @@ class TestCaptchaUrlValidation:
             assert "evil.com" not in str(e)
             assert "jira.example.com/login.jsp" in str(e)
 
+    def test_no_denied_reason_header_passes(self):
+        resp = mock.Mock()
+        resp.headers = {}
+        assert _check_captcha_challenge(resp, "https://jira.example.com") is None
+
+    def test_other_denied_reason_passes(self):
+        resp = self._make_response("AUTHENTICATED_FAILED")
+        assert _check_captcha_challenge(resp, "https://jira.example.com") is None
+
+    def test_captcha_header_url_with_trailing_space(self):
+        resp = self._make_response("CAPTCHA_CHALLENGE; login-url=https://jira.example.com/login.jsp?x=1 ")
+        with pytest.raises(CaptchaError) as exc_info:
+            _check_captcha_challenge(resp, "https://jira.example.com")
+        assert exc_info.value.login_url == "https://jira.example.com/login.jsp?x=1"
+
     def test_captcha_no_header_url_uses_default(self):
         """When no login-url in header, use default jira_url/login.jsp."""
         resp = self._make_response("CAPTCHA_CHALLENGE")
@@ -475,6 +668,12 @@ class TestCaptchaUrlValidation:
         except Exception as e:
             assert "jira.example.com/login.jsp" in str(e)
 
+    def test_captcha_without_login_url_skips_urlparse(self):
+        resp = self._make_response("CAPTCHA_CHALLENGE")
+        with mock.patch("lib.client.urlparse") as mock_parse, pytest.raises(CaptchaError):
+            _check_captcha_challenge(resp, "https://jira.example.com")
+        mock_parse.assert_not_called()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: _sanitize_error() credential redaction (F7)
@@ -508,6 +707,17 @@ class TestSanitizeError:
         assert "hunter2" not in result
         assert "***" in result
 
+    def test_authorization_header_redacted_as_one_unit(self):
+        assert _sanitize_error("Authorization: Bearer abc failed") == "Authorization: *** failed"
+
+    def test_key_before_authorization_header_does_not_leak_its_value(self):
+        result = _sanitize_error("basic Authorization: Token s3cr3t")
+        assert "s3cr3t" not in result
+
+    def test_redacts_every_occurrence_in_one_pass(self):
+        result = _sanitize_error("token=a1 then api_key=b2 and Authorization: Basic c3")
+        assert result == "token=*** then api_key=*** and Authorization: ***"
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: resolve_assignee()
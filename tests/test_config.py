@@ -122,6 +122,32 @@ class TestLoadProfiles:
             with pytest.raises(ValueError, match="No profiles defined"):
                 load_profiles()
 
+    def test_unchanged_file_is_parsed_once(self, profiles_dir):
+        with (
+            mock.patch("lib.config.PROFILES_FILE", profiles_dir / "profiles.json"),
+            mock.patch("lib.config._json_loads", wraps=json.loads) as mock_loads,
+        ):
+            first = load_profiles()
+            assert load_profiles() is first
+        assert mock_loads.call_count <= 1
+
+    def test_stdlib_fallback_parses_profiles(self, tmp_path):
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text(json.dumps({"profiles": {"ü": {"url": "https://a.example.com"}}}), encoding="utf-8")
+        with (
+            mock.patch("lib.config.PROFILES_FILE", profiles_file),
+            mock.patch("lib.config._json_loads", json.loads),
+        ):
+            assert list(load_profiles()["profiles"]) == ["ü"]
+
+    def test_rewritten_file_is_reparsed(self, tmp_path):
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text(json.dumps({"profiles": {"a": {"url": "https://a.example.com"}}}))
+        with mock.patch("lib.config.PROFILES_FILE", profiles_file):
+            assert list(load_profiles()["profiles"]) == ["a"]
+            profiles_file.write_text(json.dumps({"profiles": {"bb": {"url": "https://b.example.com"}}}))
+            assert list(load_profiles()["profiles"]) == ["bb"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: resolve_profile()
@@ -136,6 +162,14 @@ class TestResolveProfile:
             assert result["url"] == "https://jira.meine-krankenkasse.de"
             assert result["auth"] == "pat"
 
+    def test_resolved_profile_does_not_touch_cached_data(self, profiles_dir):
+        with mock.patch("lib.config.PROFILES_FILE", profiles_dir / "profiles.json"):
+            result = resolve_profile(profile="mkk")
+            result["url"] = "https://changed.example.com"
+            cached = load_profiles()["profiles"]["mkk"]
+            assert "name" not in cached
+            assert cached["url"] == "https://jira.meine-krankenkasse.de"
+
     def test_explicit_profile_not_found(self, profiles_dir):
         with mock.patch("lib.config.PROFILES_FILE", profiles_dir / "profiles.json"):
             with pytest.raises(ValueError, match="Profile 'nonexistent' not found"):
@@ -179,6 +213,23 @@ class TestResolveProfile:
             with pytest.raises(ValueError, match="WEB found in profiles"):
                 resolve_profile(issue_key="WEB-100")
 
+    def test_shared_host_resolves_to_first_profile(self, tmp_path):
+        """Host lookup keeps profiles.json order: the first profile on a host wins."""
+        shared = {
+            "version": 1,
+            "profiles": {
+                "first": {"url": "https://jira.example.com:443", "auth": "pat", "token": "x"},
+                "second": {"url": "https://JIRA.example.com/", "auth": "pat", "token": "y", "projects": ["WEB", "WEB"]},
+            },
+        }
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text(json.dumps(shared))
+
+        with mock.patch("lib.config.PROFILES_FILE", profiles_file):
+            assert resolve_profile(url="https://jira.example.com/browse/X-1")["name"] == "first"
+            # A project listed twice in one profile is not ambiguous
+            assert resolve_profile(issue_key="WEB-1")["name"] == "second"
+
     def test_directory_context_jira_profile(self, profiles_dir, project_dir):
         with mock.patch("lib.config.PROFILES_FILE", profiles_dir / "profiles.json"):
             result = resolve_profile(project_dir=str(project_dir))
@@ -315,6 +366,13 @@ class TestIsCloudUrl:
         """Must not match domains that merely contain 'atlassian.net'."""
         assert is_cloud_url("https://fake-atlassian.net.attacker.com") is False
 
+    def test_uppercase_cloud_host(self):
+        assert is_cloud_url("https://Company.ATLASSIAN.NET/") is True
+
+    def test_domain_only_in_path_or_query(self):
+        """The substring prescreen must still defer to the netloc check."""
+        assert is_cloud_url("https://jira.example.com/login?next=https://x.atlassian.net") is False
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: load_config()
@@ -420,6 +478,28 @@ class TestLoadEnvExportPrefix:
         assert config["JIRA_PERSONAL_TOKEN"] == "my-token"
 
 
+class TestLoadEnvCache:
+    """load_env() reuses the parsed file until it changes on disk."""
+
+    def test_unchanged_file_is_read_once(self, tmp_path):
+        env_file = tmp_path / ".env.jira"
+        env_file.write_text("JIRA_URL=https://jira.example.com\n")
+        with mock.patch("builtins.open", wraps=open) as mock_open:
+            first = load_env(str(env_file))
+            first["JIRA_CLOUD"] = "true"
+            second = load_env(str(env_file))
+        assert mock_open.call_count == 1
+        # Callers get their own copy of the cached parse
+        assert "JIRA_CLOUD" not in second
+
+    def test_rewritten_file_is_reparsed(self, tmp_path):
+        env_file = tmp_path / ".env.jira"
+        env_file.write_text("JIRA_URL=https://old.example.com\n")
+        assert load_env(str(env_file))["JIRA_URL"] == "https://old.example.com"
+        env_file.write_text("JIRA_URL=https://jira.new.example.com\n")
+        assert load_env(str(env_file))["JIRA_URL"] == "https://jira.new.example.com"
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: load_status_sets() — qa / working / resolved status name resolution
 # ═══════════════════════════════════════════════════════════════════════════════
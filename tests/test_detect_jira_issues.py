@@ -1,6 +1,8 @@
 """Tests for detect_jira_issues.py hook script."""
 
+import io
 import json
+import os
 import sys
 from pathlib import Path
 from unittest import mock
@@ -13,6 +15,8 @@ _scripts_dir = _test_dir.parent / "scripts"
 sys.path.insert(0, str(_scripts_dir))
 
 from detect_jira_issues import (
+    _normalize_netloc,
+    extract_all,
     extract_issue_keys,
     extract_jira_hosts,
     resolve_profile_suggestion,
@@ -50,6 +54,12 @@ class TestExtractIssueKeys:
         keys = extract_issue_keys("FIX_ME-123 is an issue")
         assert "FIX_ME-123" in keys
 
+    def test_lowercase_only_text_short_circuits(self):
+        assert extract_issue_keys("fix web-1381 before release") == []
+
+    def test_text_without_hyphen_short_circuits(self):
+        assert extract_issue_keys("WEB 1381 is not a key") == []
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: extract_issue_keys() denylist — non-Jira PREFIX-123 false positives
@@ -123,6 +133,9 @@ class TestExtractJiraHosts:
     def test_no_hosts(self):
         assert extract_jira_hosts("No URLs here WEB-123") == []
 
+    def test_bare_host_without_scheme_ignored(self):
+        assert extract_jira_hosts("see jira.example.com/browse/WEB-1") == []
+
     def test_trailing_punctuation_stripped(self):
         """URLs with trailing punctuation like ').' should be cleaned."""
         hosts = extract_jira_hosts("see https://jira.example.com).")
@@ -134,6 +147,57 @@ class TestExtractJiraHosts:
         assert hosts == ["https://jira.example.com"]
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tests: _normalize_netloc()
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestExtractAll:
+    def test_keys_and_hosts_in_one_scan(self):
+        text = "WEB-2 regressed, see https://jira.example.com/browse/NRS-1). and https://acme.atlassian.net"
+        assert extract_all(text) == (
+            ["NRS-1", "WEB-2"],
+            ["https://acme.atlassian.net", "https://jira.example.com"],
+        )
+
+    def test_browse_url_placeholder_dropped(self):
+        assert extract_all("https://jira.example.com/browse/PROJ-123") == ([], ["https://jira.example.com"])
+
+    def test_key_in_query_string_without_path(self):
+        assert extract_all("https://jira.example.com?selectedIssue=NRS-12") == (
+            ["NRS-12"],
+            ["https://jira.example.com"],
+        )
+        assert extract_all("https://acme.atlassian.net#CLOUD-7") == (["CLOUD-7"], ["https://acme.atlassian.net"])
+
+    def test_plain_text(self):
+        assert extract_all("nothing to see here") == ([], [])
+
+    def test_lowercase_hyphenated_prompt_skips_regex_scan(self):
+        with mock.patch("detect_jira_issues._SCAN_RE") as scan_re:
+            assert extract_all("please re-run the follow-up checks") == ([], [])
+        scan_re.finditer.assert_not_called()
+
+
+class TestNormalizeNetloc:
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://Jira.Example.COM", "jira.example.com"),
+            ("https://jira.example.com:443/browse/WEB-1", "jira.example.com"),
+            ("http://jira.example.com:80", "jira.example.com"),
+            ("http://jira.example.com:443", "jira.example.com:443"),
+            ("https://jira.example.com:8443", "jira.example.com:8443"),
+            ("HTTPS://jira.example.com:443?x=1", "jira.example.com"),
+            ("https://jira.example.com#frag", "jira.example.com"),
+            ("jira.example.com", ""),
+            ("", ""),
+        ],
+    )
+    def test_normalize(self, url, expected):
+        assert _normalize_netloc(url) == expected
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: resolve_profile_suggestion()
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -209,6 +273,33 @@ class TestResolveProfileSuggestion:
             result = resolve_profile_suggestion(["WEB-100"], [])
             assert result is None
 
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        """A second lookup against an unchanged profiles.json reuses the cached parse."""
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text(json.dumps(SAMPLE_PROFILES))
+
+        with mock.patch("detect_jira_issues.PROFILES_FILE", profiles_file):
+            assert resolve_profile_suggestion(["NRS-1"], []) == "netresearch"
+            with mock.patch("detect_jira_issues._json_loads") as loads:
+                assert resolve_profile_suggestion(["WEB-1"], []) == "mkk"
+            loads.assert_not_called()
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """Bumping the mtime of profiles.json invalidates the cached parse."""
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text(json.dumps(SAMPLE_PROFILES))
+
+        with mock.patch("detect_jira_issues.PROFILES_FILE", profiles_file):
+            assert resolve_profile_suggestion(["WEB-1"], []) == "mkk"
+
+            updated = json.loads(json.dumps(SAMPLE_PROFILES))
+            updated["profiles"]["mkk"]["projects"] = ["INFRA"]
+            profiles_file.write_text(json.dumps(updated))
+            st = profiles_file.stat()
+            os.utime(profiles_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            assert resolve_profile_suggestion(["WEB-1"], []) is None
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: resolve_profile_suggestion() with malformed profiles.json
@@ -218,6 +309,15 @@ class TestResolveProfileSuggestion:
 class TestResolveProfileSuggestionMalformed:
     """resolve_profile_suggestion() must not crash on unexpected JSON shapes."""
 
+    def test_invalid_json_returns_none(self, tmp_path):
+        """profiles.json that is not valid JSON at all."""
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text("{not json")
+
+        with mock.patch("detect_jira_issues.PROFILES_FILE", profiles_file):
+            result = resolve_profile_suggestion(["WEB-1"], [])
+            assert result is None
+
     def test_json_is_list_returns_none(self, tmp_path):
         """profiles.json containing a JSON list instead of dict."""
         profiles_file = tmp_path / "profiles.json"
@@ -258,8 +358,10 @@ class TestMainOutput:
         """Run detect_jira_issues.main() with mocked stdin."""
         input_data = json.dumps({"prompt": prompt_text})
         fake_profiles = tmp_path / "nonexistent" / "profiles.json"
-        with mock.patch("sys.stdin") as mock_stdin, mock.patch("detect_jira_issues.PROFILES_FILE", fake_profiles):
-            mock_stdin.read.return_value = input_data
+        with (
+            mock.patch("sys.stdin", io.StringIO(input_data)),
+            mock.patch("detect_jira_issues.PROFILES_FILE", fake_profiles),
+        ):
             from detect_jira_issues import main
 
             main()
@@ -292,6 +394,33 @@ class TestMainOutput:
         assert "/core/jira-issue.py" in captured.out
         assert "/workflow/jira-comment.py" in captured.out
 
+    def test_prompt_without_digits_skips_json_parse(self, tmp_path, capsys):
+        """Prompts that cannot hold an issue key must not be JSON-parsed."""
+        with mock.patch("detect_jira_issues.json.loads") as mock_loads:
+            captured = self._run_hook("Refactor the WEB-style client", tmp_path, capsys)
+        mock_loads.assert_not_called()
+        assert captured.out == ""
+
+    def test_plain_text_input_skips_json_parse(self, tmp_path, capsys):
+        """Non-JSON stdin is used as the prompt without a parse attempt."""
+        fake_profiles = tmp_path / "nonexistent" / "profiles.json"
+        with (
+            mock.patch("sys.stdin", io.StringIO("Check WEB-1381")),
+            mock.patch("detect_jira_issues.PROFILES_FILE", fake_profiles),
+            mock.patch("detect_jira_issues.json.loads") as mock_loads,
+        ):
+            from detect_jira_issues import main
+
+            main()
+        mock_loads.assert_not_called()
+        assert "WEB-1381" in capsys.readouterr().out
+
+    def test_key_spanning_read_blocks(self, tmp_path, capsys):
+        """Hyphen and digit arriving in different stdin blocks still match."""
+        with mock.patch("detect_jira_issues._STDIN_BLOCK_SIZE", 4):
+            captured = self._run_hook("Check WEB-1381", tmp_path, capsys)
+        assert "WEB-1381" in captured.out
+
     def test_output_warns_against_python3(self, tmp_path, capsys):
         """Hook output should warn against using python3 directly."""
         captured = self._run_hook("Check WEB-1381", tmp_path, capsys)
@@ -126,3 +126,10 @@ def test_no_safety_net_notice_on_default_view(capsys):
     _mod._print_issue(_issue({"summary": "S", "customfield_10071": "some value"}))
     out = capsys.readouterr().out
     assert "customfield_10071" not in out
+
+
+def test_multiline_description_indents_every_line(capsys):
+    """Each description line, including blank ones, keeps the two-space indent."""
+    _mod._print_issue(_issue({"summary": "S", "description": "first\n\nthird"}))
+    out = capsys.readouterr().out
+    assert "\nDescription:\n  first\n  \n  third\n" in out
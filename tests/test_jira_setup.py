@@ -7,6 +7,9 @@ import sys
 from pathlib import Path
 from unittest import mock
 
+import click.testing
+import pytest
+
 # Add scripts to path for lib imports
 _test_dir = Path(__file__).parent
 _scripts_path = _test_dir.parent / "skills" / "jira-communication" / "scripts"
@@ -205,11 +208,64 @@ class TestWriteProfileExistingBackup:
         assert "rescue" in data["profiles"]
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tests: write_profile() replaces profiles.json atomically
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestWriteProfileAtomic:
+    """write_profile() must swap in a complete 0600 file and never leave a torn one."""
+
+    def test_existing_loose_file_replaced_with_0600(self, tmp_path):
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text(json.dumps({"version": 1, "default": "a", "profiles": {"a": {"url": "u"}}}))
+        profiles_file.chmod(0o644)
+
+        with mock.patch.object(jira_setup, "PROFILES_FILE", profiles_file):
+            jira_setup.write_profile("b", {"url": "https://jira.example.com", "auth": "pat", "token": "t"})
+
+        assert stat.S_IMODE(profiles_file.stat().st_mode) == 0o600
+        assert set(json.loads(profiles_file.read_text())["profiles"]) == {"a", "b"}
+        assert list(tmp_path.iterdir()) == [profiles_file]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        profiles_file = tmp_path / "profiles.json"
+        original = json.dumps({"version": 1, "default": "a", "profiles": {"a": {"url": "u"}}})
+        profiles_file.write_text(original)
+
+        with (
+            mock.patch.object(jira_setup, "PROFILES_FILE", profiles_file),
+            mock.patch.object(jira_setup.json, "dumps", side_effect=ValueError("boom")),
+            pytest.raises(ValueError, match="boom"),
+        ):
+            jira_setup.write_profile("b", {"url": "https://jira.example.com"})
+
+        assert profiles_file.read_text() == original
+        assert list(tmp_path.iterdir()) == [profiles_file]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: validate_url() treats reachable status codes as success
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+class TestUrlProbeDuringTypePrompt:
+    """main() probes the URL while the type prompt waits, and reports before credentials."""
+
+    def test_unreachable_url_aborts_before_credentials(self):
+        runner = click.testing.CliRunner()
+        with (
+            mock.patch.object(jira_setup, "validate_url", return_value=(False, "Connection failed")) as probe,
+            mock.patch.object(jira_setup, "validate_credentials") as creds,
+        ):
+            result = runner.invoke(jira_setup.main, ["--url", "https://jira.example.com", "--test-only"], input="y\n")
+        assert result.exit_code == jira_setup.EXIT_VALIDATION_FAILED
+        probe.assert_called_once_with("https://jira.example.com")
+        creds.assert_not_called()
+        assert result.output.index("Is this correct?") < result.output.index("Validating URL...")
+        assert "Step 3" not in result.output
+
+
 class TestValidateUrlStatusCodes:
     """validate_url() must treat 405 as reachable (server rejects HEAD but is up)."""
 
@@ -218,20 +274,26 @@ class TestValidateUrlStatusCodes:
         head_resp = mock.Mock(status_code=405)
         get_resp = mock.Mock(status_code=200)
         with (
-            mock.patch.object(jira_setup.requests, "head", return_value=head_resp),
-            mock.patch.object(jira_setup.requests, "get", return_value=get_resp),
+            mock.patch.object(jira_setup._http_session(), "head", return_value=head_resp),
+            mock.patch.object(jira_setup._http_session(), "get", return_value=get_resp),
         ):
             ok, msg = jira_setup.validate_url("https://jira.example.com")
         assert ok is True
         assert "reachable" in msg.lower()
 
+    def test_probe_uses_split_connect_read_timeout(self):
+        """The HEAD probe fails fast on connect instead of a single 10 s budget."""
+        with mock.patch.object(jira_setup._http_session(), "head", return_value=mock.Mock(status_code=200)) as head:
+            jira_setup.validate_url("https://jira.example.com")
+        assert head.call_args.kwargs["timeout"] == jira_setup.URL_CHECK_TIMEOUT == (3, 7)
+
     def test_405_falls_back_to_get_with_auth_required(self):
         """On HEAD 405 + GET 401, server is reachable but needs auth."""
         head_resp = mock.Mock(status_code=405)
         get_resp = mock.Mock(status_code=401)
         with (
-            mock.patch.object(jira_setup.requests, "head", return_value=head_resp),
-            mock.patch.object(jira_setup.requests, "get", return_value=get_resp),
+            mock.patch.object(jira_setup._http_session(), "head", return_value=head_resp),
+            mock.patch.object(jira_setup._http_session(), "get", return_value=get_resp),
         ):
             ok, msg = jira_setup.validate_url("https://jira.example.com")
         assert ok is True
@@ -260,6 +322,22 @@ class TestValidateCredentialsTimeout:
             jira_setup.validate_credentials("https://jira.example.com", "server", personal_token="pat-123")
             assert MockJira.call_args[1].get("timeout") == JIRA_TIMEOUT
 
+    def test_client_reuses_url_probe_session(self):
+        """The credential check rides on the session validate_url() already warmed up."""
+        with mock.patch.object(jira_setup, "Jira") as MockJira:
+            MockJira.return_value.myself.return_value = {"displayName": "Test"}
+            jira_setup.validate_credentials("https://jira.example.com", "server", personal_token="pat-123")
+            assert MockJira.call_args[1].get("session") is jira_setup._http_session()
+
+    def test_atlassian_loaded_lazily(self):
+        """Without a patched module-level Jira, the class comes from lib.client._jira_class()."""
+        assert jira_setup.Jira is None
+        with mock.patch.object(jira_setup, "_jira_class") as jira_class:
+            jira_class.return_value.return_value.myself.return_value = {"displayName": "Test"}
+            ok, _msg = jira_setup.validate_credentials("https://jira.example.com", "server", personal_token="p")
+        assert ok
+        jira_class.assert_called_once_with()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: validate_credentials() handles string response from myself()
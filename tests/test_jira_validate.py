@@ -6,6 +6,8 @@ import sys
 from pathlib import Path
 from unittest import mock
 
+import click.testing
+
 # Add scripts to path for lib imports
 _test_dir = Path(__file__).parent
 _scripts_path = _test_dir.parent / "skills" / "jira-communication" / "scripts"
@@ -53,7 +55,7 @@ class TestValidateAllProfilesHttpThreshold:
 
         with (
             mock.patch("lib.config.PROFILES_FILE", profiles_file),
-            mock.patch("requests.head", return_value=mock_response),
+            mock.patch.object(jira_validate._http_session(), "head", return_value=mock_response),
         ):
             exit_code = jira_validate.validate_all_profiles(output_json=True)
 
@@ -159,7 +161,7 @@ class TestValidateAllProfilesMissingUrl:
 
         with (
             mock.patch("lib.config.PROFILES_FILE", profiles_file),
-            mock.patch("requests.head", return_value=mock_response),
+            mock.patch.object(jira_validate._http_session(), "head", return_value=mock_response),
         ):
             exit_code = jira_validate.validate_all_profiles(output_json=True)
 
@@ -261,7 +263,7 @@ class TestValidateAllProfilesExitCodes:
 
         with (
             mock.patch("lib.config.PROFILES_FILE", profiles_file),
-            mock.patch("requests.head", side_effect=Exception("timeout")),
+            mock.patch.object(jira_validate._http_session(), "head", side_effect=Exception("timeout")),
         ):
             exit_code = jira_validate.validate_all_profiles(output_json=True)
 
@@ -288,7 +290,7 @@ class TestValidateAllProfilesExitCodes:
 
         with (
             mock.patch("lib.config.PROFILES_FILE", profiles_file),
-            mock.patch("requests.head", side_effect=Exception("timeout")),
+            mock.patch.object(jira_validate._http_session(), "head", side_effect=Exception("timeout")),
         ):
             exit_code = jira_validate.validate_all_profiles(output_json=True)
 
@@ -346,3 +348,200 @@ class TestCheckEnvironmentVerboseOutput:
         assert config is not None
         captured = capsys.readouterr()
         assert "Environment file" in captured.out
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tests: check_connectivity() probes serverInfo with one short request
+# ═══════════════════════════════════════════════════════════════════════════════
+
+PAT_CONFIG = {"JIRA_URL": "https://jira.example.com", "JIRA_PERSONAL_TOKEN": "tok"}
+
+
+class TestCheckConnectivity:
+    """Reachability is one short serverInfo request; authentication uses the client."""
+
+    def test_server_info_replaces_head_probe(self, capsys):
+        client = mock.Mock()
+        client.myself.return_value = {"displayName": "Jane", "emailAddress": "jane@example.com"}
+        server_info = mock.Mock(status_code=200)
+        server_info.json.return_value = {"version": "9.12.0"}
+
+        with (
+            mock.patch.object(jira_validate, "LazyJiraClient", return_value=client) as lazy_cls,
+            mock.patch.object(jira_validate.requests, "get", return_value=server_info) as mock_get,
+            mock.patch.object(jira_validate._http_session(), "head") as mock_head,
+        ):
+            ok, info = jira_validate.check_connectivity(PAT_CONFIG, None, verbose=True)
+
+        assert ok is True
+        assert info["server_reachable"] is True
+        assert info["user"] == "Jane"
+        lazy_cls.assert_called_once_with(config=PAT_CONFIG)
+        assert mock_get.call_args.args[0] == f"{PAT_CONFIG['JIRA_URL']}/rest/api/2/serverInfo"
+        mock_head.assert_not_called()
+        assert "Jira 9.12.0" in capsys.readouterr().out
+
+    def test_probe_uses_short_timeout_not_client_session(self):
+        with (
+            mock.patch.object(jira_validate, "LazyJiraClient") as lazy_cls,
+            mock.patch.object(jira_validate.requests, "get", return_value=mock.Mock(status_code=401)) as mock_get,
+        ):
+            jira_validate.check_connectivity(PAT_CONFIG, None)
+
+        assert mock_get.call_args.kwargs["timeout"] == jira_validate.SERVER_INFO_TIMEOUT == 10
+        lazy_cls.return_value.get.assert_not_called()
+
+    def test_timeout_reports_probe_budget(self, capsys):
+        with (
+            mock.patch.object(jira_validate, "LazyJiraClient") as lazy_cls,
+            mock.patch.object(jira_validate.requests, "get", side_effect=jira_validate.requests.exceptions.Timeout()),
+        ):
+            ok, _info = jira_validate.check_connectivity(PAT_CONFIG, None)
+
+        assert ok is False
+        assert "within 10 seconds" in capsys.readouterr().err
+        lazy_cls.return_value.myself.assert_not_called()
+
+    def test_connection_error_stops_before_authentication(self, capsys):
+        client = mock.Mock()
+
+        with (
+            mock.patch.object(jira_validate, "LazyJiraClient", return_value=client),
+            mock.patch.object(
+                jira_validate.requests, "get", side_effect=jira_validate.requests.exceptions.ConnectionError("refused")
+            ),
+        ):
+            ok, info = jira_validate.check_connectivity(PAT_CONFIG, None)
+
+        assert ok is False
+        assert "server_reachable" not in info
+        client.myself.assert_not_called()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tests: check_runtime() only spawns `uv --version` when it is reported
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestCheckRuntime:
+    """The uv version probe is a subprocess; skip it unless shown."""
+
+    def test_quiet_run_skips_uv_version_subprocess(self):
+        with (
+            mock.patch.object(jira_validate.shutil, "which", return_value="/usr/bin/uv"),
+            mock.patch("subprocess.run") as mock_run,
+        ):
+            ok, info = jira_validate.check_runtime(verbose=False)
+
+        assert ok is True
+        assert info["uv_path"] == "/usr/bin/uv"
+        assert "uv_version" not in info
+        mock_run.assert_not_called()
+
+    def test_reported_run_includes_uv_version(self):
+        completed = mock.Mock(returncode=0, stdout="uv 0.5.0\n")
+        with (
+            mock.patch.object(jira_validate.shutil, "which", return_value="/usr/bin/uv"),
+            mock.patch("subprocess.run", return_value=completed) as mock_run,
+        ):
+            ok, info = jira_validate.check_runtime(verbose=False, report_versions=True)
+
+        assert info["uv_version"] == "uv 0.5.0"
+        assert mock_run.call_args.args[0] == ["/usr/bin/uv", "--version"]
+
+
+class TestValidateAllProfilesConcurrentProbes:
+    """Profile probes run concurrently but results keep profiles.json order."""
+
+    def test_statuses_stay_aligned_with_profiles(self, tmp_path, capsys):
+        names = [f"p{i}" for i in range(6)]
+        profiles_data = {
+            "version": 1,
+            "default": "p0",
+            "profiles": {name: {"url": f"https://{name}.example.com", "auth": "pat", "token": "tok"} for name in names},
+        }
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text(json.dumps(profiles_data))
+
+        def fake_head(url, **kwargs):
+            # Odd profiles are down; the status must land on the right row
+            if int(url.split("//p")[1][0]) % 2:
+                raise ConnectionError("down")
+            return mock.Mock(status_code=200)
+
+        with (
+            mock.patch("lib.config.PROFILES_FILE", profiles_file),
+            mock.patch.object(jira_validate._http_session(), "head", side_effect=fake_head),
+        ):
+            exit_code = jira_validate.validate_all_profiles(output_json=True)
+
+        results = json.loads(capsys.readouterr().out)
+        assert [r["Profile"] for r in results] == names
+        assert [r["Status"] for r in results] == ["OK", "UNREACHABLE"] * 3
+        assert exit_code == jira_validate.EXIT_CONNECTION_ERROR
+
+
+class TestProbeSession:
+    """The shared probe session retries briefly and splits connect/read timeouts."""
+
+    def test_adapter_retries_transient_failures(self):
+        retry = jira_validate._http_session().get_adapter("https://jira.example.com").max_retries
+        assert retry.total == 2
+        assert retry.connect == 2
+        assert 503 in retry.status_forcelist
+        # Exhausted status retries report "HTTP 503" rather than raising
+        assert retry.raise_on_status is False
+
+    def test_probe_uses_split_timeout(self):
+        with mock.patch.object(
+            jira_validate._http_session(), "head", return_value=mock.Mock(status_code=200)
+        ) as mock_head:
+            assert jira_validate._probe_status("https://jira.example.com") == "OK"
+        assert mock_head.call_args.kwargs["timeout"] == jira_validate.PROBE_TIMEOUT == (3, 5)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tests: main() result emission for --json / --quiet
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestMainResultEmission:
+    """Every exit path reports through the same --json / --quiet emitter."""
+
+    def _invoke(self, tmp_path, *args):
+        missing_env = str(tmp_path / "missing.env")
+        runner = click.testing.CliRunner()
+        with mock.patch.object(jira_validate.shutil, "which", return_value="/usr/bin/uv"):
+            return runner.invoke(jira_validate.main, ["--env-file", missing_env, *args])
+
+    def test_quiet_config_error(self, tmp_path):
+        result = self._invoke(tmp_path, "--quiet")
+        assert result.exit_code == jira_validate.EXIT_CONFIG_ERROR
+        assert result.stdout.strip() == "error"
+
+    def test_json_config_error(self, tmp_path):
+        with mock.patch("subprocess.run", return_value=mock.Mock(returncode=0, stdout="uv 0.5.0")):
+            result = self._invoke(tmp_path, "--json")
+        assert result.exit_code == jira_validate.EXIT_CONFIG_ERROR
+        payload = json.loads(result.stdout)
+        assert payload["status"] == "error"
+        assert payload["error"] == "config_error"
+        assert payload["runtime"]["uv_version"] == "uv 0.5.0"
+
+    def test_offline_skips_connectivity(self, tmp_path):
+        env_file = tmp_path / ".env.jira"
+        env_file.write_text("JIRA_URL=https://jira.example.com\nJIRA_PERSONAL_TOKEN=tok\n")
+        runner = click.testing.CliRunner()
+        with (
+            mock.patch.object(jira_validate.shutil, "which", return_value="/usr/bin/uv"),
+            mock.patch.object(jira_validate, "check_connectivity") as mock_connectivity,
+        ):
+            result = runner.invoke(jira_validate.main, ["--env-file", str(env_file), "--offline", "--quiet"])
+        assert result.exit_code == jira_validate.EXIT_SUCCESS, result.output
+        assert result.stdout.strip() == "ok"
+        mock_connectivity.assert_not_called()
+
+    def test_offline_rejects_project_check(self, tmp_path):
+        result = self._invoke(tmp_path, "--offline", "--project", "PROJ")
+        assert result.exit_code == 2
+        assert "--offline cannot be combined" in result.output
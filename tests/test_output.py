@@ -1,14 +1,20 @@
 """Tests for output.py — extract_adf_text() and comment_to_text() helpers."""
 
+import io
+import json
+import subprocess
 import sys
+from datetime import datetime
 from pathlib import Path
+from unittest import mock
 
 # Add scripts to path for lib imports
 _test_dir = Path(__file__).parent
 _scripts_path = _test_dir.parent / "skills" / "jira-communication" / "scripts"
 sys.path.insert(0, str(_scripts_path))
 
-from lib.output import comment_to_text, compact_json, extract_adf_text
+import lib.output as output_mod
+from lib.output import comment_to_text, compact_json, extract_adf_text, format_json, format_table, stream_table
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Tests: extract_adf_text()
@@ -47,6 +53,27 @@ class TestExtractAdfText:
         adf = {"type": "doc"}
         assert extract_adf_text(adf) == ""
 
+    def test_deep_nesting_beyond_recursion_limit(self):
+        """Nesting deeper than the interpreter recursion limit must not raise."""
+        adf = {"type": "doc", "content": []}
+        node = adf
+        for _ in range(sys.getrecursionlimit() + 100):
+            child = {"type": "blockquote", "content": []}
+            node["content"].append(child)
+            node = child
+        node["content"].append({"type": "text", "text": "bottom"})
+        assert extract_adf_text(adf) == "bottom"
+
+    def test_document_order_preserved(self):
+        adf = {
+            "type": "doc",
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}]},
+                {"type": "table", "content": [{"type": "tableRow", "content": [{"type": "text", "text": "c"}]}]},
+            ],
+        }
+        assert extract_adf_text(adf) == "a b c"
+
     def test_heading_extracted(self):
         """Headings must be included in extracted text (F9)."""
         adf = {
@@ -238,3 +265,93 @@ class TestCommentToText:
         result = comment_to_text(adf)
         assert "{'type'" not in result
         assert "real text" in result
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tests: format_json()
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestFormatJson:
+    """format_json() must match json.dumps(indent=2, default=str) with or without orjson."""
+
+    _DATA = {
+        "key": "TEST-1",
+        "fields": {"labels": [], "assignee": None, "votes": 2.5, "watching": True, "parent": {}},
+        "created": datetime(2024, 1, 2, 3, 4, 5),
+        "byId": {10001: "x"},
+    }
+
+    def test_matches_stdlib_layout(self):
+        assert format_json(self._DATA) == json.dumps(self._DATA, indent=2, default=str)
+
+    def test_stdlib_fallback_without_orjson(self):
+        with mock.patch.object(output_mod, "orjson", None):
+            assert format_json(self._DATA) == json.dumps(self._DATA, indent=2, default=str)
+
+    def test_oversized_int_falls_back(self):
+        assert json.loads(format_json({"n": 2**70})) == {"n": 2**70}
+
+    def test_non_default_indent(self):
+        assert format_json({"a": 1}, indent=4) == json.dumps({"a": 1}, indent=4)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tests: format_table()
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestFormatTable:
+    def test_columns_padded_to_widest_cell(self):
+        rows = [{"key": "A-1", "status": "Open"}, {"key": "LONG-100", "status": None}]
+        assert format_table(rows).splitlines() == [
+            "key      | status",
+            "---------+-------",
+            "A-1      | Open  ",
+            "LONG-100 | None  ",
+        ]
+
+    def test_accepts_generator(self):
+        rows = ({"key": f"A-{i}"} for i in range(3))
+        assert format_table(rows, ["key"]).splitlines()[2:] == ["A-0", "A-1", "A-2"]
+
+    def test_empty_input(self):
+        assert format_table([]) == "(no data)"
+        assert format_table(iter(())) == "(no data)"
+
+    def test_missing_column_renders_empty(self):
+        assert format_table([{"key": "A-1"}], ["key", "summary"]).splitlines()[2] == "A-1 |        "
+
+
+class TestStreamTable:
+    def test_matches_printed_format_table(self):
+        rows = [{"key": "A-1", "status": "Open"}, {"key": "LONG-100", "status": None}]
+        out = io.StringIO()
+        stream_table(iter(rows), ["key", "status"], out=out)
+        assert out.getvalue() == format_table(rows, ["key", "status"]) + "\n"
+
+    def test_empty_input(self):
+        out = io.StringIO()
+        stream_table([], out=out)
+        assert out.getvalue() == "(no data)\n"
+
+    def test_defaults_to_stdout(self, capsys):
+        stream_table([{"key": "A-1"}])
+        assert capsys.readouterr().out == "key\n---\nA-1\n"
+
+
+class TestLazyPackageExports:
+    def test_importing_output_does_not_load_client(self):
+        """lib/__init__ resolves re-exports lazily, so lib.output stays requests-free."""
+        code = "import sys, lib.output; print('lib.client' in sys.modules, 'requests' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, cwd=_scripts_path, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_package_reexports_resolve(self):
+        import lib
+
+        assert lib.format_table is format_table
+        assert sorted(lib.__all__) == sorted(lib._EXPORTS)
+        assert lib.LazyJiraClient.__module__ == "lib.client"